@@ -303,6 +303,8 @@ class DeliveryRiskAgent:
                     f"feasible={d.feasible}, recommended={d.recommended}"
                     for d in decision_comparison
                 ])
+                evidence = "\n".join(f"- {r}" for r in reasons)
+                action_list = "\n".join(f"- {a}" for a in actions)
 
                 prompt = f"""
 Project: {project.get('name', project_id)} (Team: {team_name})
@@ -313,13 +315,13 @@ Agent Opinions:
 {agent_summary}
 
 Evidence from Graph (REAL ticket data):
-{chr(10).join(['- ' + r for r in reasons])}
+{evidence}
 
 Decision Comparison Table:
 {decision_table}
 
 Recommended Actions:
-{chr(10).join(['- ' + a for a in actions])}
+{action_list}
 
 Task: Provide a 3-sentence analysis:
 1. Summarize the PRIMARY risk driver using ONLY the evidence above.
@@ -16,6 +16,9 @@ MC_DISTRIBUTIONS = {
 
 N_SIMULATIONS = 1000  # Increased for NumPy performance
 
+# Shared generator for trials when the caller doesn't pass one
+_rng = np.random.default_rng()
+
 class SimulationAgent:
     """
     The 'What-If' Engine with Monte Carlo simulation.
@@ -26,11 +29,13 @@ class SimulationAgent:
     def __init__(self):
         self.constraint_agent = ConstraintAgent()
 
-    def _monte_carlo(self, action: str, context: Dict[str, Any]) -> Dict[str, float]:
+    def _monte_carlo(self, action: str, context: Dict[str, Any], rng: np.random.Generator = None) -> Dict[str, float]:
         """
         Run N_SIMULATIONS trials for one action using Vectorized NumPy.
+        Pass rng to draw from a caller-owned (e.g. seeded) Generator.
         Returns: mean_rr, p5_rr, p95_rr, mean_cp, prob_positive
         """
+        rng = rng or _rng
         dist = MC_DISTRIBUTIONS.get(action, {"rr_mean": 0, "rr_std": 0.05, "cp_mean": 0, "cp_std": 0.02})
         rr_mean = dist["rr_mean"]
         rr_std = dist["rr_std"]
@@ -68,8 +73,8 @@ class SimulationAgent:
 
         # ── Vectorized Simulation ──
         # Generate N samples at once
-        rr_samples = np.random.normal(loc=rr_mean, scale=rr_std, size=N_SIMULATIONS)
-        cp_samples = np.random.normal(loc=cp_mean, scale=cp_std, size=N_SIMULATIONS)
+        rr_samples = rng.normal(loc=rr_mean, scale=rr_std, size=N_SIMULATIONS)
+        cp_samples = rng.normal(loc=cp_mean, scale=cp_std, size=N_SIMULATIONS)
         
         # Clip to [0, 1]
         rr_samples = np.clip(rr_samples, 0.0, 1.0)
@@ -9,9 +9,10 @@ predict risk impact of team changes before they happen.
 """
 
 import random
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from ..core.neo4j_client import neo4j_client
-from ..core.context_manager import context_assembler
+from ..core.context_manager import context_assembler, open_blockers
 from .simulation import SimulationAgent, MC_DISTRIBUTIONS, N_SIMULATIONS
 
 import logging
@@ -138,10 +139,9 @@ class TeamCompositionSimulator:
         raw = context_assembler.get_project_raw(project_id)
         tickets = raw["tickets"]
 
-        blocked = [t for t in tickets if t.get("blocker_id") and t.get("blocker_status") != "Done"]
+        blocked = [t for t in tickets if open_blockers(t)]
         active = [t for t in tickets if t.get("status") != "Done"]
 
-        from datetime import datetime
         now = datetime.now()
         days_to_deadline = 30
         if raw["project"].get("deadline"):
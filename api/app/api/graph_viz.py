@@ -7,6 +7,7 @@ Used exclusively for the Knowledge Graph visualization page.
 from fastapi import APIRouter, Query
 from neo4j import GraphDatabase
 from typing import List, Dict, Any, Optional
+import asyncio
 import logging
 
 from app.core.config import settings
@@ -19,7 +20,8 @@ router = APIRouter(prefix="/api/graph-viz", tags=["graph-viz"])
 try:
     viz_driver = GraphDatabase.driver(
         settings.GRAPH_VIZ_NEO4J_URI,
-        auth=(settings.GRAPH_VIZ_NEO4J_USERNAME, settings.GRAPH_VIZ_NEO4J_PASSWORD)
+        auth=(settings.GRAPH_VIZ_NEO4J_USERNAME, settings.GRAPH_VIZ_NEO4J_PASSWORD),
+        max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
     )
     logger.info(f"✅ Connected to Graph-Viz Neo4j: {settings.GRAPH_VIZ_NEO4J_URI}")
 except Exception as e:
@@ -27,6 +29,20 @@ except Exception as e:
     viz_driver = None
 
 
+def _execute_read(work, *args):
+    """Run a read transaction function in a session on the shared driver."""
+    with viz_driver.session() as session:
+        return session.execute_read(work, *args)
+
+
+async def _read_async(work, *args):
+    """
+    Run _execute_read on a worker thread so Bolt I/O doesn't block the
+    event loop and concurrent requests share the driver's connection pool.
+    """
+    return await asyncio.to_thread(_execute_read, work, *args)
+
+
 def get_filtered_graph_data(tx, departments: List[str], min_perf: float, show_skills: bool, project_id: Optional[str]):
     """
     Fetch filtered graph data from graph-viz Neo4j database.
@@ -70,10 +86,16 @@ def get_filtered_graph_data(tx, departments: List[str], min_perf: float, show_sk
     // 6. Combine all
     WITH employees, departments, skills, projects, (employees + departments + skills + projects) as all_nodes
     
-    // 7. Find internal relationships
+    // 7. Find internal relationships: expand from the selected nodes rather
+    //    than scanning every relationship, emit each one once, and return
+    //    plain columns so the driver ships scalars/maps instead of Node objects
+    UNWIND all_nodes AS n
     MATCH (n)-[r]->(m)
-    WHERE n IN all_nodes AND m IN all_nodes
-    RETURN n, r, m
+    WHERE m IN all_nodes
+    WITH DISTINCT n, r, m
+    RETURN elementId(n) AS nid, coalesce(labels(n)[0], 'Node') AS nlabel, properties(n) AS nprops,
+           type(r) AS rtype, properties(r) AS rprops,
+           elementId(m) AS mid, coalesce(labels(m)[0], 'Node') AS mlabel, properties(m) AS mprops
     """
     
     all_depts = True if not departments else False
@@ -83,31 +105,21 @@ def get_filtered_graph_data(tx, departments: List[str], min_perf: float, show_sk
     
     nodes = {}
     links = []
+    links_append = links.append
     
-    for record in result:
-        n = record['n']
-        m = record['m']
-        r = record['r']
-        
-        if n.element_id not in nodes:
-            nodes[n.element_id] = {
-                "id": n.element_id, 
-                "label": list(n.labels)[0] if n.labels else "Node",
-                "properties": dict(n)
-            }
+    # Records are tuples in RETURN order; unpacking skips the per-key lookups
+    for nid, nlabel, nprops, rtype, rprops, mid, mlabel, mprops in result:
+        if nid not in nodes:
+            nodes[nid] = {"id": nid, "label": nlabel, "properties": nprops}
         
-        if m.element_id not in nodes:
-            nodes[m.element_id] = {
-                "id": m.element_id,
-                "label": list(m.labels)[0] if m.labels else "Node",
-                "properties": dict(m)
-            }
+        if mid not in nodes:
+            nodes[mid] = {"id": mid, "label": mlabel, "properties": mprops}
             
-        links.append({
-            "source": n.element_id,
-            "target": m.element_id,
-            "type": r.type,
-            "properties": dict(r)
+        links_append({
+            "source": nid,
+            "target": mid,
+            "type": rtype,
+            "properties": rprops
         })
         
     return {"nodes": list(nodes.values()), "links": links}
@@ -147,16 +159,13 @@ async def get_graph(
     
     dept_list = [d.strip() for d in departments.split(',') if d.strip()]
     
-    with viz_driver.session() as session:
-        data = session.execute_read(
-            get_filtered_graph_data, 
-            dept_list, 
-            min_perf, 
-            show_skills, 
-            project_id if project_id else None
-        )
-    
-    return data
+    return await _read_async(
+        get_filtered_graph_data,
+        dept_list,
+        min_perf,
+        show_skills,
+        project_id if project_id else None
+    )
 
 
 @router.get("/projects")
@@ -165,10 +174,7 @@ async def list_projects() -> List[Dict[str, str]]:
     if not viz_driver:
         return []
     
-    with viz_driver.session() as session:
-        data = session.execute_read(get_projects)
-    
-    return data
+    return await _read_async(get_projects)
 
 
 @router.get("/skills")
@@ -177,7 +183,4 @@ async def get_skills() -> Dict[str, List[str]]:
     if not viz_driver:
         return {}
     
-    with viz_driver.session() as session:
-        data = session.execute_read(get_skills_by_category)
-    
-    return data
+    return await _read_async(get_skills_by_category)
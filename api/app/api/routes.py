@@ -7,7 +7,7 @@ from pydantic import BaseModel
 import logging
 
 import logging
-from ..core.cache import invalidate_project_risk
+from ..core.cache import invalidate_project_risk, mark_project_viewed
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +103,7 @@ async def get_project_detail(project_id: str):
         project = get_project(project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
+        mark_project_viewed(project_id)
         return project
     except HTTPException:
         raise
@@ -0,0 +1,48 @@
+"""
+Admission control for upstream LLM calls.
+
+Caps how many LLM requests a worker has in flight so bursts queue here
+instead of tripping the provider's rate limits. Interactive chat runs at
+high priority; report-style generation runs at low priority and cannot take
+the slots reserved for chat.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+from .config import settings
+
+
+class AdmissionController:
+    """Counter of active slots guarded by an asyncio.Condition."""
+
+    def __init__(self, limit: int, reserved: int = 0):
+        self.limit = max(1, limit)
+        self.reserved = min(max(0, reserved), self.limit - 1)
+        self.active = 0
+        self._cond = asyncio.Condition()
+
+    def _available(self, priority: str) -> bool:
+        cap = self.limit if priority == "high" else self.limit - self.reserved
+        return self.active < cap
+
+    async def acquire(self, priority: str = "high"):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._available(priority))
+            self.active += 1
+
+    async def release(self):
+        async with self._cond:
+            self.active -= 1
+            # Waiters differ in priority, so wake them all to re-check
+            self._cond.notify_all()
+
+    @asynccontextmanager
+    async def slot(self, priority: str = "high"):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            await self.release()
+
+
+llm_admission = AdmissionController(settings.LLM_MAX_CONCURRENCY, settings.LLM_RESERVED_FOR_CHAT)
@@ -1,23 +1,307 @@
 """
-Centralized in-memory cache for risk analysis results.
+Centralized in-memory cache for risk analysis results, LLM responses,
+the knowledge graph payload and stale-while-revalidate endpoint data.
 Allows invalidation from CRUD routes when data changes.
 """
-from typing import Dict, Optional, Any
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Any, Tuple
+import asyncio
+import functools
+import hashlib
+import logging
+import re
 import time
 
-# Simple in-memory cache: { project_id: { "result": ..., "ts": ... } }
-_risk_cache: Dict[str, dict] = {}
+logger = logging.getLogger(__name__)
+
+# Bounded LRU: { (project_id, local_version, db_version): { "result": ..., "ts": ... } }
+_risk_cache: "OrderedDict[Tuple[str, int, int], dict]" = OrderedDict()
 RISK_CACHE_TTL = 300  # 5 minutes
+RISK_CACHE_MAX_ENTRIES = 256
+
+# In-flight analyses, so concurrent misses for one key share a single run
+_risk_inflight: Dict[Tuple[str, int, int], "asyncio.Task"] = {}
+
+# Bumped on every CRUD write so graph-derived caches miss immediately:
+# the global counter for whole-graph payloads, the per-project one for
+# project-scoped entries. db_version is the shared Neo4j cache version
+# (crud.get_cache_version), which also covers writes made by other processes.
+_graph_version = 0
+_project_versions: Dict[str, int] = {}
+
+def get_graph_version() -> int:
+    return _graph_version
 
-def get_cached_risk(project_id: str) -> Optional[Any]:
-    entry = _risk_cache.get(project_id)
+def _risk_key(project_id: str, db_version: int = 0) -> Tuple[str, int, int]:
+    return (project_id, _project_versions.get(project_id, 0), db_version)
+
+def _store_risk(key: Tuple[str, int, int], result: Any):
+    _risk_cache[key] = {"result": result, "ts": time.time()}
+    _risk_cache.move_to_end(key)
+    while len(_risk_cache) > RISK_CACHE_MAX_ENTRIES:
+        _risk_cache.popitem(last=False)
+
+def get_cached_risk(project_id: str, db_version: int = 0) -> Optional[Any]:
+    key = _risk_key(project_id, db_version)
+    entry = _risk_cache.get(key)
     if entry and (time.time() - entry["ts"]) < RISK_CACHE_TTL:
+        _risk_cache.move_to_end(key)
         return entry["result"]
     return None
 
-def set_cached_risk(project_id: str, result: Any):
-    _risk_cache[project_id] = {"result": result, "ts": time.time()}
+def set_cached_risk(project_id: str, result: Any, db_version: int = 0):
+    _store_risk(_risk_key(project_id, db_version), result)
+
+async def _run_once(
+    inflight: Dict[Hashable, "asyncio.Task"], key: Hashable,
+    make: Callable[[], Awaitable[Any]], store: Callable[[Any], None],
+) -> Any:
+    """
+    Await make() for key, sharing one run between concurrent callers. The
+    run is its own task and every caller awaits it through asyncio.shield,
+    so a caller that is cancelled (e.g. its client disconnected) only stops
+    waiting: the others still get the result, and it is still cached.
+    """
+    task = inflight.get(key)
+    if task is None:
+        async def run():
+            try:
+                result = await make()
+                store(result)
+                return result
+            finally:
+                inflight.pop(key, None)
+
+        # No await between the lookup and registering the task, so this is
+        # atomic on the event loop without an explicit lock.
+        task = inflight[key] = asyncio.ensure_future(run())
+        # Mark the error retrieved when every caller has gone away
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return await asyncio.shield(task)
+
+async def get_or_compute_risk(
+    project_id: str, compute: Callable[[str], Awaitable[Any]], db_version: int = 0,
+) -> Any:
+    """
+    Return the cached risk result for a project, or await compute(project_id).
+    Concurrent callers that miss on the same key await the one in-flight run
+    instead of starting their own.
+    """
+    cached = get_cached_risk(project_id, db_version)
+    if cached is not None:
+        return cached
+    key = _risk_key(project_id, db_version)
+    return await _run_once(
+        _risk_inflight, key, lambda: compute(project_id), lambda result: _store_risk(key, result),
+    )
 
 def invalidate_project_risk(project_id: str):
-    if project_id in _risk_cache:
-        del _risk_cache[project_id]
+    global _graph_version
+    _graph_version += 1
+    _project_versions[project_id] = _project_versions.get(project_id, 0) + 1
+    for key in [k for k in _risk_cache if k[0] == project_id]:
+        del _risk_cache[key]
+    for key in [k for k in _context_cache if k[0] == project_id]:
+        del _context_cache[key]
+
+
+
+# ── Recently viewed projects ──────────────────────────────────────────────
+# Project ids touched by project-scoped routes, most recent last. The risk
+# prefetcher warms these first since they are the likeliest to be asked
+# about next.
+_recent_projects: "OrderedDict[str, float]" = OrderedDict()
+RECENT_PROJECTS_MAX = 32
+
+def mark_project_viewed(project_id: str):
+    _recent_projects[project_id] = time.time()
+    _recent_projects.move_to_end(project_id)
+    while len(_recent_projects) > RECENT_PROJECTS_MAX:
+        _recent_projects.popitem(last=False)
+
+def recent_projects() -> List[str]:
+    """Recently viewed project ids, most recent first."""
+    return list(reversed(_recent_projects))
+
+
+# ── Project context cache ─────────────────────────────────────────────────
+# The assembled chat context string; same key scheme as the risk cache.
+_context_cache: Dict[Tuple[str, int, int], dict] = {}
+_context_inflight: Dict[Tuple[str, int, int], "asyncio.Task"] = {}
+CONTEXT_CACHE_TTL = 30  # seconds
+
+def get_cached_context(project_id: str, db_version: int = 0) -> Optional[str]:
+    entry = _context_cache.get(_risk_key(project_id, db_version))
+    if entry and (time.time() - entry["ts"]) < CONTEXT_CACHE_TTL:
+        return entry["result"]
+    return None
+
+def _store_context(key: Tuple[str, int, int], context: str):
+    # Drop expired entries so old versions don't accumulate
+    now = time.time()
+    for k in [k for k, v in _context_cache.items() if now - v["ts"] >= CONTEXT_CACHE_TTL]:
+        del _context_cache[k]
+    _context_cache[key] = {"result": context, "ts": now}
+
+def set_cached_context(project_id: str, context: str, db_version: int = 0):
+    _store_context(_risk_key(project_id, db_version), context)
+
+async def get_or_build_context(
+    project_id: str, build: Callable[[], Awaitable[str]], db_version: int = 0,
+) -> str:
+    """
+    Return the cached context for a project, or await build(). Concurrent
+    callers that miss on the same key share the one in-flight build, the
+    same way get_or_compute_risk coalesces risk analyses.
+    """
+    cached = get_cached_context(project_id, db_version)
+    if cached is not None:
+        return cached
+    key = _risk_key(project_id, db_version)
+    return await _run_once(
+        _context_inflight, key, build, lambda context: _store_context(key, context),
+    )
+
+
+# ── LLM response cache ────────────────────────────────────────────────────
+# Keyed on a hash of the exact prompt, so any change in the underlying
+# graph data produces a new key and stale answers are never served.
+_llm_cache: Dict[str, dict] = {}
+LLM_CACHE_TTL = 600  # 10 minutes
+LLM_CACHE_MAX_ENTRIES = 256
+
+def llm_cache_key(*parts: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+def get_cached_llm(key: str) -> Optional[Any]:
+    entry = _llm_cache.get(key)
+    if entry and (time.time() - entry["ts"]) < LLM_CACHE_TTL:
+        return entry["result"]
+    return None
+
+def set_cached_llm(key: str, result: Any):
+    if key not in _llm_cache and len(_llm_cache) >= LLM_CACHE_MAX_ENTRIES:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _llm_cache[next(iter(_llm_cache))]
+    _llm_cache[key] = {"result": result, "ts": time.time()}
+
+
+# ── Similar-question cache ────────────────────────────────────────────────
+# Answers reused across rewordings of the same question ("which projects
+# are at risk?" / "please show which projects are at risk"). Scoped by the
+# caller to the exact context the answer was built from, so a data change
+# never serves a stale answer; within a scope, two questions match only if
+# they use exactly the same set of terms once stopwords are dropped. There
+# is no fuzzy tier: "is Phoenix at risk" and "is Atlas at risk" differ in a
+# single term and must never share an answer. Question words (who/what/
+# why/...) and negations are kept as terms, since they change what is asked.
+_similar_cache: Dict[str, Dict[frozenset, dict]] = {}
+SIMILAR_CACHE_TTL = 600  # 10 minutes
+SIMILAR_CACHE_MAX_PER_SCOPE = 64
+SIMILAR_CACHE_MAX_SCOPES = 128
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are be can could do does for i in is it me of on or please "
+    "show tell the there this to us was will with".split()
+)
+
+def _question_terms(text: str) -> frozenset:
+    return frozenset(w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS)
+
+def get_similar_llm(scope: str, question: str) -> Optional[Any]:
+    entries = _similar_cache.get(scope)
+    terms = _question_terms(question)
+    if not entries or not terms:
+        return None
+    entry = entries.get(terms)
+    if entry and time.time() - entry["ts"] < SIMILAR_CACHE_TTL:
+        return entry["result"]
+    return None
+
+def set_similar_llm(scope: str, question: str, result: Any):
+    terms = _question_terms(question)
+    if not terms:
+        return
+    entries = _similar_cache.pop(scope, None)
+    if entries is None:
+        if len(_similar_cache) >= SIMILAR_CACHE_MAX_SCOPES:
+            del _similar_cache[next(iter(_similar_cache))]
+        entries = {}
+    _similar_cache[scope] = entries  # re-inserted as most recent
+    entries.pop(terms, None)
+    if len(entries) >= SIMILAR_CACHE_MAX_PER_SCOPE:
+        del entries[next(iter(entries))]
+    entries[terms] = {"result": result, "ts": time.time()}
+
+
+# ── Knowledge graph cache ─────────────────────────────────────────────────
+# Small LRU keyed on a graph version tuple; the payload is a pure function
+# of the graph contents, so a matching key can be served as-is.
+_graph_cache: Dict[Hashable, dict] = {}
+GRAPH_CACHE_TTL = 60  # 1 minute
+GRAPH_CACHE_MAX_ENTRIES = 4
+
+def get_cached_graph(key: Hashable) -> Optional[Any]:
+    entry = _graph_cache.get(key)
+    if entry and (time.time() - entry["ts"]) < GRAPH_CACHE_TTL:
+        # Re-insert to mark as most recently used
+        _graph_cache[key] = _graph_cache.pop(key)
+        return entry["result"]
+    return None
+
+def set_cached_graph(key: Hashable, result: Any):
+    _graph_cache.pop(key, None)
+    if len(_graph_cache) >= GRAPH_CACHE_MAX_ENTRIES:
+        del _graph_cache[next(iter(_graph_cache))]
+    _graph_cache[key] = {"result": result, "ts": time.time()}
+
+
+# ── Stale-while-revalidate ────────────────────────────────────────────────
+# For read-heavy dashboard data: fresh entries are returned as-is, entries
+# within the stale window are returned immediately while one background
+# task recomputes them, and anything older (or written since) is awaited.
+def swr_cache(ttl: float, stale: float):
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        entries: Dict[Hashable, dict] = {}
+        pending: Dict[Hashable, "asyncio.Task"] = {}
+
+        async def refresh(key: Hashable, args: tuple, kwargs: dict) -> Any:
+            version = _graph_version
+            result = await fn(*args, **kwargs)
+            entries[key] = {"result": result, "ts": time.time(), "version": version}
+            return result
+
+        def start_refresh(key: Hashable, args: tuple, kwargs: dict) -> "asyncio.Task":
+            task = pending.get(key)
+            if task is None:
+                task = pending[key] = asyncio.create_task(refresh(key, args, kwargs))
+
+                def done(t: "asyncio.Task"):
+                    pending.pop(key, None)
+                    if not t.cancelled() and t.exception():
+                        logger.warning(f"{fn.__name__} refresh failed: {t.exception()}")
+
+                task.add_done_callback(done)
+            return task
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = entries.get(key)
+            if entry and entry["version"] == _graph_version:
+                age = time.time() - entry["ts"]
+                if age < ttl:
+                    return entry["result"]
+                if age < ttl + stale:
+                    start_refresh(key, args, kwargs)
+                    return entry["result"]
+            # Miss: concurrent callers share one computation
+            return await asyncio.shield(start_refresh(key, args, kwargs))
+
+        return wrapper
+    return decorator
@@ -14,6 +14,21 @@ class Settings(BaseSettings):
     NEO4J_PASSWORD: str = ""
     NEO4J_DATABASE: str = "neo4j"
 
+    # Neo4j driver connection pool — shared by all requests in a worker
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 50
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 30.0  # seconds
+    NEO4J_MAX_CONNECTION_LIFETIME: int = 3600  # seconds
+
+    # Upstream LLM admission — concurrent calls per worker, and how many of
+    # those slots only interactive chat may use
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_RESERVED_FOR_CHAT: int = 2
+
+    # Background risk precomputation cadence in seconds. Off by default: each
+    # sweep runs an LLM analysis per stale project. Leave at 0 on serverless
+    # deployments, where background tasks don't survive
+    RISK_PREFETCH_INTERVAL: int = 0
+
     # CORS — allow localhost + production deployments
     CORS_ORIGINS: list[str] = [
         "http://localhost:8080",
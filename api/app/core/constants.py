@@ -49,6 +49,14 @@ INTERVENTION_IMPACTS = {
     },
 }
 
+# ============================================================================
+# FINANCE ASSUMPTIONS  (Decision Economics dashboard)
+# ============================================================================
+
+AVG_DAILY_COST = 180               # USD/day per member
+AVG_TICKET_REVENUE_UNIT = 8000     # Estimated revenue per delivered ticket
+BASE_REVENUE_PER_MEMBER = 3000     # Base monthly revenue contribution per member
+
 # ============================================================================
 # RISK LEVEL THRESHOLDS
 # ============================================================================
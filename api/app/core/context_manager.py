@@ -8,7 +8,7 @@ and team info into a structured context block with TTL caching.
 import logging
 import time
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import date
 
 from .neo4j_client import neo4j_client
 
@@ -17,6 +17,11 @@ logger = logging.getLogger(__name__)
 CONTEXT_TTL = 300  # 5 minutes
 
 
+def open_blockers(ticket: dict) -> List[dict]:
+    """Blockers of a ticket (from get_project_raw) that aren't Done yet."""
+    return [b for b in ticket.get("blockers") or () if b.get("status") != "Done"]
+
+
 class ContextAssembler:
     """
     Builds rich context blocks for LLM consumption by querying
@@ -49,20 +54,22 @@ class ContextAssembler:
         if cached:
             return cached
 
+        # Tickets are aggregated in a subquery, with assignee and blockers
+        # resolved per ticket, so there's no ticket x assignee x blocker
+        # cross product to de-duplicate.
         records, _ = neo4j_client.execute_query("""
             MATCH (p:Project {id: $pid})
             OPTIONAL MATCH (t:Team)-[:HAS_PROJECT]->(p)
-            OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-            OPTIONAL MATCH (tk)<-[:ASSIGNED_TO]-(m:Member)
-            OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
-            RETURN p { .* } AS project,
-                   t.name AS team,
-                   collect(DISTINCT tk {
-                       .*, assignee: m.name,
-                       blocker_id: blocker.id,
-                       blocker_title: blocker.title,
-                       blocker_status: blocker.status
-                   }) AS tickets
+            CALL {
+                WITH p
+                OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+                RETURN collect(tk {
+                    .*,
+                    assignee: head([(tk)<-[:ASSIGNED_TO]-(m:Member) | m.name]),
+                    blockers: [(tk)<-[:BLOCKED_BY]-(b:Ticket) | b { .id, .title, .status }]
+                }) AS tickets
+            }
+            RETURN p { .* } AS project, t.name AS team, tickets
         """, {"pid": project_id})
 
         if not records:
@@ -122,19 +129,22 @@ class ContextAssembler:
 
     def _compute_ticket_analytics(self, tickets: List[dict]) -> dict:
         """Compute blocking, overdue, velocity signals from tickets."""
-        now = datetime.now()
-        active = [t for t in tickets if t.get("status") != "Done"]
-        done = [t for t in tickets if t.get("status") == "Done"]
-        blocked = [
-            t for t in tickets
-            if t.get("blocker_id") and t.get("blocker_status") != "Done"
-        ]
+        # A ticket due today already counts as overdue
+        today = date.today()
+        active = []
+        done = []
+        blocked = []
         overdue = []
         for t in tickets:
-            if t.get("status") != "Done" and t.get("dueDate"):
+            if open_blockers(t):
+                blocked.append(t)
+            if t.get("status") == "Done":
+                done.append(t)
+                continue
+            active.append(t)
+            if t.get("dueDate"):
                 try:
-                    d = datetime.strptime(t["dueDate"], "%Y-%m-%d")
-                    if d < now:
+                    if date.fromisoformat(t["dueDate"]) <= today:
                         overdue.append(t)
                 except ValueError:
                     pass
@@ -145,6 +155,7 @@ class ContextAssembler:
             "done": len(done),
             "blocked_count": len(blocked),
             "overdue_count": len(overdue),
+            "active_tickets": active,
             "blocked_tickets": blocked,
             "overdue_tickets": overdue,
             "completion_pct": round(len(done) / max(len(tickets), 1) * 100, 1),
@@ -167,8 +178,6 @@ class ContextAssembler:
         tickets = raw["tickets"]
         analytics = self._compute_ticket_analytics(tickets)
 
-        active = [t for t in tickets if t.get("status") != "Done"]
-
         lines = [
             "=== PROJECT CONTEXT (live from Neo4j) ===",
             f"Project: {proj.get('name', project_id)} (id: {project_id})",
@@ -179,7 +188,7 @@ class ContextAssembler:
             f"Tickets ({analytics['active']} active / {analytics['total']} total, {analytics['completion_pct']}% complete):",
         ]
 
-        for t in active[:12]:
+        for t in analytics["active_tickets"][:12]:
             lines.append(
                 f"  - [{t.get('status')}] {t.get('id')}: {t.get('title')} "
                 f"(priority: {t.get('priority')}, assignee: {t.get('assignee', 'unassigned')}, "
@@ -189,7 +198,8 @@ class ContextAssembler:
         lines.append(f"\nBlocked ({analytics['blocked_count']}):")
         if analytics["blocked_tickets"]:
             for t in analytics["blocked_tickets"]:
-                lines.append(f"  - {t.get('id')} blocked by {t.get('blocker_id')} \"{t.get('blocker_title')}\"")
+                blockers = ", ".join(f"{b.get('id')} \"{b.get('title')}\"" for b in open_blockers(t))
+                lines.append(f"  - {t.get('id')} blocked by {blockers}")
         else:
             lines.append("  None")
 
@@ -7,6 +7,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Bumps the shared cache version from inside a write query (a unit
+# subquery, run once per matched row). It lives on its own node rather
+# than on the Project so it never shows up in p { .* } payloads, and it is
+# global because a write can change other projects' risk/context too
+# (e.g. reassigning a ticket shifts member workload everywhere).
+CACHE_VERSION_BUMP = """
+    CALL {
+        MERGE (v:CacheVersion {id: 'graph'})
+        SET v.version = coalesce(v.version, 0) + 1
+    }
+"""
+
 
 # ============================================================================
 # TEAMS
@@ -166,6 +178,7 @@ def create_ticket(project_id: str, ticket_data: Dict[str, Any]) -> Dict[str, Any
     
     query = """
     MATCH (p:Project {id: $project_id})
+    """ + CACHE_VERSION_BUMP + """
     CREATE (tk:Ticket {
         id: $id,
         title: $title,
@@ -214,6 +227,7 @@ def update_ticket(ticket_id: str, ticket_data: Dict[str, Any]) -> Optional[Dict[
     
     query = """
     MATCH (tk:Ticket {id: $ticket_id})
+    """ + CACHE_VERSION_BUMP + """
     SET tk.title = $title,
         tk.description = $description,
         tk.priority = $priority,
@@ -255,6 +269,7 @@ def update_ticket_status(ticket_id: str, new_status: str) -> Optional[Dict[str,
     """Update just the status of a ticket (for drag-drop)."""
     query = """
     MATCH (tk:Ticket {id: $ticket_id})
+    """ + CACHE_VERSION_BUMP + """
     SET tk.status = $status
     RETURN tk { .* } as ticket
     """
@@ -271,6 +286,7 @@ def delete_ticket(ticket_id: str) -> bool:
     """Delete a ticket and its relationships."""
     query = """
     MATCH (tk:Ticket {id: $ticket_id})
+    """ + CACHE_VERSION_BUMP + """
     DETACH DELETE tk
     RETURN count(tk) as deleted
     """
@@ -278,6 +294,21 @@ def delete_ticket(ticket_id: str) -> bool:
     return True
 
 
+def get_cache_version() -> int:
+    """
+    Get the shared cache version, bumped by every write above. Lets caches
+    in other processes notice writes they didn't see.
+    """
+    query = """
+    OPTIONAL MATCH (v:CacheVersion {id: 'graph'})
+    RETURN coalesce(v.version, 0) as version
+    """
+    records, _ = neo4j_client.execute_query(query)
+    if records:
+        return records[0]["version"]
+    return 0
+
+
 def get_ticket_project_id(ticket_id: str) -> Optional[str]:
     """Get the project ID for a given ticket."""
     query = """
@@ -24,6 +24,26 @@ class MockNeo4jClient:
         """
         query_upper = query.upper()
         
+        # Shared cache version (mock data is never written)
+        if "V.VERSION, 0) AS VERSION" in query_upper:
+            return [{"version": 0}], None
+
+        # Active project ids (risk prefetcher)
+        if "RETURN P.ID AS PROJECT_ID" in query_upper:
+            return [
+                {"project_id": proj["id"]}
+                for team in self.data["teams"] for proj in team["projects"]
+            ], None
+
+        # 0. Knowledge graph (teams, members, projects, assignments in one record)
+        if "AS TEAMS" in query_upper and "AS ASSIGNMENTS" in query_upper:
+            return [{
+                "teams": self._graph_teams(),
+                "members": self._graph_members(),
+                "projects": self._graph_projects(),
+                "assignments": self._graph_assignments(),
+            }], None
+
         # 1. System Users
         if "MATCH (SU:SYSTEMUSER)" in query_upper:
             return [
@@ -123,55 +143,74 @@ class MockNeo4jClient:
 
         # 1. Graph Members
         if "MATCH (M:MEMBER)" in query_upper and "OPTIONAL MATCH (M)-[:MEMBER_OF]->(T:TEAM)" in query_upper:
-            results = []
-            for m in self.data["members"]:
-                # active tickets
-                active = len([t for t in self.data["tickets"] if t["assignee_id"] == m["id"] and t["status"] != "Done"])
-                results.append({
-                    "member": m,
-                    "team_id": m["team_id"],
-                    "active_tickets": active
-                })
-            return results, None
+            return self._graph_members(), None
 
         # 2. Graph Projects
         # MATCH (p:Project)<-[:HAS_PROJECT]-(t:Team)
         # Note: The query in main.py uses lower case p, t. upper() handles this.
         if "MATCH (P:PROJECT)<-[:HAS_PROJECT]-(T:TEAM)" in query_upper:
-            results = []
-            for team in self.data["teams"]:
-                for proj in team["projects"]:
-                    # active tickets for this project
-                    tickets = [t for t in self.data["tickets"] if t["project_id"] == proj["id"]]
-                    active = len([t for t in tickets if t["status"] != "Done"])
-                    results.append({
-                        "project": proj,
-                        "team_id": team["id"],
-                        "active_tickets": active
-                    })
-            return results, None
+            return self._graph_projects(), None
 
         # 3. Graph Assignments
         # MATCH (m:Member)-[:ASSIGNED_TO]->(tk:Ticket)<-[:HAS_TICKET]-(p:Project)
         if "MATCH (M:MEMBER)-[:ASSIGNED_TO]->(TK:TICKET)<-[:HAS_TICKET]-(P:PROJECT)" in query_upper:
-            results = []
-            # Derive assignments from tickets
-            seen = set()
-            for t in self.data["tickets"]:
-                if t["assignee_id"] and t["project_id"]:
-                    pair = (t["assignee_id"], t["project_id"])
-                    if pair not in seen:
-                        seen.add(pair)
-                        results.append({
-                            "member_id": t["assignee_id"],
-                            "project_id": t["project_id"]
-                        })
-            return results, None
+            return self._graph_assignments(), None
 
         # Default fallback for unhandled queries (return empty to valid crash)
         logger.warning(f"Mock Client: Unhandled query: {query}")
         return [], None
 
+    def _graph_teams(self):
+        return [
+            {
+                "team": team,
+                "member_count": len([m for m in self.data["members"] if m["team_id"] == team["id"]]),
+                "project_count": len(team["projects"]),
+            }
+            for team in self.data["teams"]
+        ]
+
+    def _graph_members(self):
+        results = []
+        for m in self.data["members"]:
+            # active tickets
+            active = len([t for t in self.data["tickets"] if t["assignee_id"] == m["id"] and t["status"] != "Done"])
+            results.append({
+                "member": m,
+                "team_id": m["team_id"],
+                "active_tickets": active
+            })
+        return results
+
+    def _graph_projects(self):
+        results = []
+        for team in self.data["teams"]:
+            for proj in team["projects"]:
+                # active tickets for this project
+                tickets = [t for t in self.data["tickets"] if t["project_id"] == proj["id"]]
+                active = len([t for t in tickets if t["status"] != "Done"])
+                results.append({
+                    "project": proj,
+                    "team_id": team["id"],
+                    "active_tickets": active
+                })
+        return results
+
+    def _graph_assignments(self):
+        results = []
+        # Derive assignments from tickets
+        seen = set()
+        for t in self.data["tickets"]:
+            if t["assignee_id"] and t["project_id"]:
+                pair = (t["assignee_id"], t["project_id"])
+                if pair not in seen:
+                    seen.add(pair)
+                    results.append({
+                        "member_id": t["assignee_id"],
+                        "project_id": t["project_id"]
+                    })
+        return results
+
     def _generate_mock_data(self):
         teams = [
             {"id": "t1", "name": "Alpha Squad", "description": "Core Backend Engine"},
@@ -143,6 +143,20 @@ class ModelRouter:
 
     # ── Core dispatch ─────────────────────────────────────────────────────
 
+    @staticmethod
+    def _build_messages(cfg: _ModelConfig, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Fold leading caller system messages into the task system prompt.
+        Keeps the static instructions as one byte-identical prefix so the
+        provider's automatic prompt caching can reuse it across calls.
+        """
+        system_parts = [cfg.system_prompt]
+        idx = 0
+        while idx < len(messages) and messages[idx]["role"] == "system":
+            system_parts.append(messages[idx]["content"])
+            idx += 1
+        return [{"role": "system", "content": "\n\n".join(system_parts)}] + messages[idx:]
+
     def generate(
         self,
         task: TaskType,
@@ -150,7 +164,7 @@ class ModelRouter:
     ) -> str:
         """Synchronous generation with task-specific model + prompt."""
         cfg = MODEL_REGISTRY[task]
-        full = [{"role": "system", "content": cfg.system_prompt}] + messages
+        full = self._build_messages(cfg, messages)
         try:
             t0 = time.time()
             resp = self.client.chat.completions.create(
@@ -160,7 +174,8 @@ class ModelRouter:
                 max_tokens=cfg.max_tokens,
             )
             elapsed = time.time() - t0
-            logger.info(f"ModelRouter [{task.value}] model={cfg.model_id} tokens={resp.usage.total_tokens if resp.usage else '?'} time={elapsed:.1f}s")
+            cached = getattr(getattr(resp.usage, "prompt_tokens_details", None), "cached_tokens", None)
+            logger.info(f"ModelRouter [{task.value}] model={cfg.model_id} tokens={resp.usage.total_tokens if resp.usage else '?'} cached={cached if cached is not None else '?'} time={elapsed:.1f}s")
             return resp.choices[0].message.content
         except Exception as e:
             logger.error(f"ModelRouter [{task.value}] error: {e}")
@@ -173,9 +188,14 @@ class ModelRouter:
         task: TaskType,
         messages: List[Dict[str, str]],
     ) -> Generator[str, None, None]:
-        """Streaming generation — yields tokens as they arrive."""
+        """
+        Streaming generation — yields tokens as they arrive. Closing the
+        generator early closes the upstream HTTP response. Raises
+        RuntimeError (like generate) if the stream fails, so a failed
+        stream is never mistaken for a complete answer.
+        """
         cfg = MODEL_REGISTRY[task]
-        full = [{"role": "system", "content": cfg.system_prompt}] + messages
+        full = self._build_messages(cfg, messages)
         try:
             stream = self.client.chat.completions.create(
                 model=cfg.model_id,
@@ -184,13 +204,14 @@ class ModelRouter:
                 max_tokens=cfg.max_tokens,
                 stream=True,
             )
-            for chunk in stream:
-                delta = chunk.choices[0].delta if chunk.choices else None
-                if delta and delta.content:
-                    yield delta.content
+            with stream:
+                for chunk in stream:
+                    delta = chunk.choices[0].delta if chunk.choices else None
+                    if delta and delta.content:
+                        yield delta.content
         except Exception as e:
             logger.error(f"ModelRouter stream [{task.value}] error: {e}")
-            yield f"[ERROR] {e}"
+            raise RuntimeError(f"LLM [{task.value}] unavailable: {str(e)}") from e
 
     # ── Intent classification ─────────────────────────────────────────────
 
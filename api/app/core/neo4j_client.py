@@ -1,5 +1,7 @@
 from neo4j import GraphDatabase
 from .config import settings
+from .schema import apply_schema
+import asyncio
 import logging
 
 try:
@@ -42,9 +44,15 @@ class Neo4jClient:
             logger.info(f"Connecting to Neo4j at {uri[:30]}...")
             
             try:
+                # One pooled driver per process; execute_query borrows a pooled
+                # bolt connection per call instead of opening a new one.
                 self._driver = GraphDatabase.driver(
                     uri,
-                    auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD)
+                    auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
+                    max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+                    connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+                    max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+                    keep_alive=True,
                 )
             except Exception as e:
                 logger.error(f"Failed to create Neo4j driver: {e}. Switching to MOCK CLIENT.")
@@ -89,6 +97,39 @@ class Neo4jClient:
         )
         return records, summary
 
+    async def execute_query_async(self, query: str, parameters: dict = None):
+        """
+        Run execute_query on a worker thread so independent queries can be
+        awaited together (asyncio.gather) without blocking the event loop.
+        """
+        # Resolve the lazy driver here so concurrent threads don't race to create it
+        _ = self.driver
+        return await asyncio.to_thread(self.execute_query, query, parameters)
+
+    def ensure_indexes(self):
+        """
+        Create the schema constraints and indexes if they don't exist yet.
+        Failures propagate to the caller. No-op on the mock client.
+        """
+        _ = self.driver
+        if self.using_mock:
+            return
+        apply_schema(lambda query, params=None: self.execute_query(query, params)[0])
+
+    def warm_query_plans(self, queries):
+        """
+        EXPLAIN each (query, params) pair so Neo4j plans and caches it before
+        the first real request. Nothing is executed. No-op on the mock client.
+        """
+        _ = self.driver
+        if self.using_mock:
+            return
+        for query, params in queries:
+            try:
+                self.execute_query("EXPLAIN " + query, params)
+            except Exception as e:
+                logger.warning(f"Query plan warm-up skipped: {e}")
+
     def close(self):
         if self._driver:
             self._driver.close()
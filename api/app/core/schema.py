@@ -0,0 +1,61 @@
+"""
+Neo4j schema shared by the API (applied at startup) and
+scripts/seed_graph_data.py (applied before seeding).
+
+Kept free of settings/driver imports so the seed script can use it
+standalone.
+"""
+
+# Keys that MERGE/MATCH look nodes up by: uniqueness constraints, each of
+# which is backed by its own index. (name, label, property)
+SCHEMA_CONSTRAINTS = (
+    ("member_id", "Member", "id"),
+    ("project_id", "Project", "id"),
+    ("ticket_id", "Ticket", "id"),
+    ("skill_name", "Skill", "name"),
+    # Single shared cache-version node (see crud.CACHE_VERSION_BUMP)
+    ("cache_version_id", "CacheVersion", "id"),
+)
+
+# Plain lookup indexes (idempotent)
+SCHEMA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS FOR (t:Team) ON (t.id)",
+    "CREATE INDEX IF NOT EXISTS FOR (su:SystemUser) ON (su.id)",
+    "CREATE INDEX IF NOT EXISTS FOR (su:SystemUser) ON (su.role)",
+    # Ticket status filters (tk.status <> 'Done' / = 'Done') on dashboards & reports
+    "CREATE INDEX ticket_status IF NOT EXISTS FOR (tk:Ticket) ON (tk.status)",
+    # Risk history: equality on project_id + ordered scan on timestamp
+    "CREATE INDEX snapshot_project_ts IF NOT EXISTS FOR (s:RiskSnapshot) ON (s.project_id, s.timestamp)",
+    "CREATE INDEX snapshot_ts IF NOT EXISTS FOR (s:RiskSnapshot) ON (s.timestamp)",
+)
+
+# A plain range index on a constrained key (created by earlier versions of
+# the schema) blocks the constraint, so it is dropped first and restored if
+# the constraint can't be created
+CONFLICTING_INDEXES_QUERY = """
+    SHOW INDEXES YIELD name, type, labelsOrTypes, properties, owningConstraint
+    WHERE type = 'RANGE' AND owningConstraint IS NULL
+      AND labelsOrTypes = [$label] AND properties = [$prop]
+    RETURN name
+"""
+
+
+def apply_schema(run):
+    """
+    Create the constraints and indexes. run(query, params=None) executes one
+    auto-commit statement and returns its records. Errors propagate: a
+    constraint that can't be created (e.g. duplicate keys) is a real problem.
+    """
+    for name, label, prop in SCHEMA_CONSTRAINTS:
+        dropped = [record["name"] for record in run(CONFLICTING_INDEXES_QUERY, {"label": label, "prop": prop})]
+        for index in dropped:
+            run(f"DROP INDEX `{index}` IF EXISTS")
+        try:
+            run(f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE")
+        except Exception:
+            # Put the lookup index back so the key isn't left unindexed
+            for index in dropped:
+                run(f"CREATE INDEX `{index}` IF NOT EXISTS FOR (n:{label}) ON (n.{prop})")
+            raise
+    for idx in SCHEMA_INDEXES:
+        run(idx)
@@ -216,19 +216,7 @@ def seed_blocked_by_relationships():
 
 def create_indexes():
     """Create Neo4j indexes for performance."""
-    indexes = [
-        "CREATE INDEX IF NOT EXISTS FOR (t:Team) ON (t.id)",
-        "CREATE INDEX IF NOT EXISTS FOR (p:Project) ON (p.id)",
-        "CREATE INDEX IF NOT EXISTS FOR (tk:Ticket) ON (tk.id)",
-        "CREATE INDEX IF NOT EXISTS FOR (m:Member) ON (m.id)",
-        "CREATE INDEX IF NOT EXISTS FOR (su:SystemUser) ON (su.id)",
-        "CREATE INDEX IF NOT EXISTS FOR (su:SystemUser) ON (su.role)",
-    ]
-    for idx in indexes:
-        try:
-            neo4j_client.execute_query(idx)
-        except Exception:
-            pass
+    neo4j_client.ensure_indexes()
     print("✅ Indexes created")
 
 
@@ -1,20 +1,40 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Any, cast
+from typing import List, Dict, Mapping, Optional, Any
+import asyncio
+import json
 import logging
+import random
+import re
+import threading
 import time
+import zlib
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
+import orjson
 from .agents.risk import DeliveryRiskAgent
-from .agents.team_simulator import TeamCompositionSimulator, TeamMutation, ROLE_PROFILES, team_simulator
-from .core.models import AnalysisResult, RiskSnapshot
-from .core.constants import ROLE_DEFINITIONS
+from .agents.team_simulator import TeamCompositionSimulator, TeamMutation, SimulationResult, ROLE_PROFILES, team_simulator
+from .core.models import AnalysisResult, AgentOpinion, DecisionComparison, RiskSnapshot
+from .core.constants import (
+    ROLE_DEFINITIONS, INTERVENTION_IMPACTS,
+    AVG_DAILY_COST, AVG_TICKET_REVENUE_UNIT, BASE_REVENUE_PER_MEMBER,
+)
 from .core.config import settings
 from .api.routes import router as crud_router
 from .core.neo4j_client import neo4j_client
 from .core.model_router import model_router, TaskType
 from .core.context_manager import context_assembler
-from .core.cache import get_cached_risk, set_cached_risk
+from .core.crud import get_cache_version
+from .core.admission import llm_admission
+from .core.cache import (
+    get_cached_risk, get_or_compute_risk, llm_cache_key, get_cached_llm, set_cached_llm,
+    get_graph_version, get_cached_graph, set_cached_graph, swr_cache,
+    get_or_build_context, get_similar_llm, set_similar_llm,
+    mark_project_viewed, recent_projects,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,7 +47,9 @@ from .agents.hiring import hiring_analytics
 app = FastAPI(
     title="AI-Driven Delivery Intelligence",
     description="Decision Intelligence Platform for Engineering Operations",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson for every JSON body; dashboards and reports are large
+    default_response_class=ORJSONResponse,
 )
 
 # ── CORS — allow frontend origins (localhost + production) ──
@@ -47,7 +69,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     instead of crashing the server or returning a raw 500 HTML page.
     """
     logger.error(f"Global exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal Server Error", "error": str(exc)}
     )
@@ -65,13 +87,46 @@ async def health_check():
     return {
         "status": "ok",
         "neo4j_connected": neo4j_ok,
+        # Tunable via NEO4J_MAX_CONNECTION_POOL_SIZE / NEO4J_CONNECTION_ACQUISITION_TIMEOUT / NEO4J_MAX_CONNECTION_LIFETIME
+        "neo4j_pool": {
+            "max_connection_pool_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+            "connection_acquisition_timeout": settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+            "max_connection_lifetime": settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        },
         "version": "2.0.0"
     }
 
 
-# ── Shutdown: close Neo4j driver ──
+def _prepare_database():
+    """Create the lookup indexes, then plan the hot read queries against them."""
+    neo4j_client.ensure_indexes()
+    neo4j_client.warm_query_plans(WARMUP_QUERIES)
+
+
+def _log_prepare_failure(task: asyncio.Task):
+    if task.cancelled():
+        return
+    e = task.exception()
+    if e is not None:
+        logger.error(f"Database preparation failed: {e}")
+
+
+# ── Startup: make sure lookup indexes exist and the hot query plans are
+# cached (in the background, so cold starts don't wait on the database) ──
+@app.on_event("startup")
+async def startup_event():
+    app.state.index_task = asyncio.create_task(asyncio.to_thread(_prepare_database))
+    app.state.index_task.add_done_callback(_log_prepare_failure)
+    app.state.prefetch_task = None
+    if settings.RISK_PREFETCH_INTERVAL > 0:
+        app.state.prefetch_task = asyncio.create_task(_risk_prefetcher())
+
+
+# ── Shutdown: stop background work, close Neo4j driver ──
 @app.on_event("shutdown")
 async def shutdown_event():
+    if app.state.prefetch_task:
+        app.state.prefetch_task.cancel()
     neo4j_client.close()
     logger.info("Neo4j connection closed")
 
@@ -83,6 +138,41 @@ app.include_router(crud_router)
 risk_agent = DeliveryRiskAgent()
 
 
+RISK_PREFETCH_QUERY = """
+    MATCH (p:Project)
+    WHERE coalesce(p.status, '') <> 'Archived'
+    RETURN p.id AS project_id
+"""
+
+
+async def _risk_prefetcher():
+    """
+    Keep the risk cache warm for every active project so chat turns read it
+    instead of paying for the analysis. Recently viewed projects go first;
+    analyses run at low LLM priority so they never crowd out live requests.
+    """
+    while True:
+        try:
+            records, _ = await neo4j_client.execute_query_async(RISK_PREFETCH_QUERY)
+            active = [r["project_id"] for r in records if r["project_id"]]
+            active_set = set(active)
+            recent = [pid for pid in recent_projects() if pid in active_set]
+            recent_set = set(recent)
+            # One version read per sweep; a write mid-sweep only means the
+            # next sweep recomputes what it invalidated
+            db_version = await asyncio.to_thread(get_cache_version)
+            for pid in recent + [pid for pid in active if pid not in recent_set]:
+                try:
+                    if get_cached_risk(pid, db_version) is not None:
+                        continue
+                    await get_or_compute_risk(pid, lambda p: _analyze_risk(p, "low"), db_version)
+                except Exception as e:
+                    logger.warning(f"Risk prefetch failed for {pid}: {e}")
+        except Exception as e:
+            logger.warning(f"Risk prefetch failed: {e}")
+        await asyncio.sleep(settings.RISK_PREFETCH_INTERVAL)
+
+
 @app.get("/api/analyze/{project_id}", response_model=AnalysisResult)
 async def analyze_project(project_id: str):
     """
@@ -91,10 +181,9 @@ async def analyze_project(project_id: str):
     """
     try:
         # Run the new debate pipeline
-        result = coordinator.run_debate(project_id)
+        result = await _run_debate(project_id)
         
         # Map debate result to AnalysisResult
-        from .core.models import AgentOpinion, DecisionComparison
         
         opinions = [
             AgentOpinion(
@@ -135,7 +224,7 @@ async def get_project_debate(project_id: str):
     Risk -> Finance -> Consumer -> Arbiter.
     """
     try:
-        return coordinator.run_debate(project_id)
+        return await _run_debate(project_id)
     except Exception as e:
         logger.error(f"Debate failed for {project_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -150,7 +239,7 @@ async def get_hiring_analytics():
     Powered by real Neo4j graph data.
     """
     try:
-        return hiring_analytics.get_full_analysis()
+        return await asyncio.to_thread(hiring_analytics.get_full_analysis)
     except Exception as e:
         logger.error(f"Hiring analytics failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -160,7 +249,7 @@ async def get_hiring_analytics():
 async def get_team_velocity():
     """Get team velocity metrics."""
     try:
-        return hiring_analytics.get_team_velocity()
+        return await asyncio.to_thread(hiring_analytics.get_team_velocity)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -169,7 +258,7 @@ async def get_team_velocity():
 async def get_skill_gaps():
     """Get skill gap analysis."""
     try:
-        return hiring_analytics.get_skill_gaps()
+        return await asyncio.to_thread(hiring_analytics.get_skill_gaps)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -178,7 +267,7 @@ async def get_skill_gaps():
 async def get_cost_efficiency():
     """Get cost efficiency metrics."""
     try:
-        return hiring_analytics.get_cost_efficiency()
+        return await asyncio.to_thread(hiring_analytics.get_cost_efficiency)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -194,25 +283,181 @@ class ChatRequest(BaseModel):
     messages: List[ChatMessage]
 
 
-def _build_project_context(project_id: str) -> str:
+async def _build_project_context(project_id: str) -> str:
     """Build a rich context block from Neo4j for the given project using ContextAssembler."""
+    mark_project_viewed(project_id)
     try:
-        # Get risk analysis result from cache or run fresh
-        risk_result = None
+        db_version = 0
         try:
-            risk_result = get_cached_risk(project_id)
-            if not risk_result:
-                risk_result = risk_agent.analyze(project_id)
-                set_cached_risk(project_id, risk_result)
+            db_version = await asyncio.to_thread(get_cache_version)
         except Exception:
             pass
-
-        ctx = context_assembler.assemble_project_context(project_id, risk_result)
-        return f"{ctx}\n=== END CONTEXT ==="
+        # Cached, or built once for all concurrent callers on this version
+        return await get_or_build_context(
+            project_id, lambda: _assemble_project_context(project_id, db_version), db_version,
+        )
     except Exception as e:
         return f"Error loading project context: {str(e)}"
 
 
+async def _assemble_project_context(project_id: str, db_version: int) -> str:
+    # Get risk analysis result from cache or run fresh (deduplicated across concurrent callers)
+    risk_result = None
+    try:
+        risk_result = await get_or_compute_risk(project_id, _analyze_risk, db_version)
+    except Exception:
+        pass
+
+    ctx = await asyncio.to_thread(context_assembler.assemble_project_context, project_id, risk_result)
+    return f"{ctx}\n=== END CONTEXT ==="
+
+
+SSE_QUEUE_SIZE = 64  # frames buffered ahead of a slow client
+SSE_KEEPALIVE_SECONDS = 15
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _llm_generate(task: TaskType, messages: List[Dict[str, str]], priority: str = "high") -> str:
+    """model_router.generate on a worker thread, once an LLM slot is free."""
+    async with llm_admission.slot(priority):
+        return await asyncio.to_thread(model_router.generate, task, messages)
+
+
+async def _analyze_risk(project_id: str, priority: str = "high"):
+    """risk_agent.analyze (which calls the LLM) on a worker thread, once an LLM slot is free."""
+    async with llm_admission.slot(priority):
+        return await asyncio.to_thread(risk_agent.analyze, project_id)
+
+
+async def _run_debate(project_id: str) -> Dict[str, Any]:
+    """coordinator.run_debate (several LLM calls) on a worker thread, once an LLM slot is free."""
+    async with llm_admission.slot("high"):
+        return await asyncio.to_thread(coordinator.run_debate, project_id)
+
+
+async def _classify_intent(query: str) -> str:
+    async with llm_admission.slot("high"):
+        return await asyncio.to_thread(model_router.classify_intent, query)
+
+
+async def _sse_events(
+    task: TaskType, messages: List[Dict[str, str]], meta: Dict[str, Any], priority: str = "high",
+    cache_key: Optional[str] = None,
+):
+    """
+    Yield SSE frames: a [META] event, the streamed tokens, then [DONE].
+
+    The upstream LLM stream is read on a worker thread into a bounded queue,
+    so a slow client applies backpressure instead of growing a buffer. A
+    comment frame is sent whenever no token arrives for SSE_KEEPALIVE_SECONDS,
+    and the upstream stream is closed once the client goes away. An LLM
+    admission slot is held until the worker reading upstream has exited. With a
+    cache_key, the tokens of a stream that runs to completion are stored in
+    the LLM cache for _sse_replay.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def put(frame: Optional[str]):
+        # Blocks the worker while the queue is full
+        asyncio.run_coroutine_threadsafe(queue.put(frame), loop).result()
+
+    def produce():
+        tokens = []
+        upstream = model_router.stream(task, messages)
+        try:
+            for token in upstream:
+                if stop.is_set():
+                    return
+                tokens.append(token)
+                put(f"data: {token}\n\n")
+            if cache_key:
+                # The caches are only touched on the event loop thread
+                loop.call_soon_threadsafe(set_cached_llm, cache_key, tuple(tokens))
+            put("data: [DONE]\n\n")
+        except Exception as e:
+            if not stop.is_set():
+                put(f"data: [ERROR] {str(e)}\n\n")
+        finally:
+            # Closes the upstream response when the client left mid-stream
+            upstream.close()
+            if not stop.is_set():
+                put(None)
+
+    # Send metadata as first event, then wait for an LLM slot while keeping
+    # the connection alive so queued clients still see progress
+    yield f"data: [META]{json.dumps(meta)}\n\n"
+    slot = asyncio.ensure_future(llm_admission.acquire(priority))
+    try:
+        while not slot.done():
+            await asyncio.wait({slot}, timeout=SSE_KEEPALIVE_SECONDS)
+            if not slot.done():
+                yield ": ping\n\n"
+        slot.result()
+    except BaseException:
+        slot.cancel()
+        if slot.done() and not slot.cancelled() and slot.exception() is None:
+            await llm_admission.release()
+        raise
+
+    def producer_done(fut: asyncio.Future):
+        if not fut.cancelled():
+            fut.exception()  # mark retrieved; frames already reported errors
+        loop.create_task(llm_admission.release())
+
+    producer = loop.run_in_executor(None, produce)
+    # The slot is given back only once the worker (and with it the upstream
+    # request) has finished, so the limiter counts real in-flight LLM calls
+    producer.add_done_callback(producer_done)
+    try:
+        while True:
+            try:
+                frame = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if frame is None:
+                break
+            yield frame
+    finally:
+        stop.set()
+        # Unblock a worker waiting on a full queue so it can see the stop flag
+        while not queue.empty():
+            queue.get_nowait()
+
+
+def _sse_replay(tokens: tuple, meta: Dict[str, Any]):
+    """Replay a cached stream with the same frames the live stream sent."""
+    yield f"data: [META]{json.dumps(meta)}\n\n"
+    for token in tokens:
+        yield f"data: {token}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def _sse_response(
+    task: TaskType, messages: List[Dict[str, str]], meta: Dict[str, Any], priority: str = "high",
+    cache_key: Optional[str] = None,
+) -> StreamingResponse:
+    if cache_key:
+        tokens = get_cached_llm(cache_key)
+        if tokens is not None:
+            return StreamingResponse(_sse_replay(tokens, meta), media_type="text/event-stream", headers=SSE_HEADERS)
+    return StreamingResponse(
+        _sse_events(task, messages, meta, priority, cache_key), media_type="text/event-stream", headers=SSE_HEADERS,
+    )
+
+
+_CODE_SPAN = re.compile(r"(```.*?```|`[^`]*`)", re.S)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_for_cache(text: str) -> str:
+    """Collapse whitespace and lowercase everything outside code spans."""
+    parts = _CODE_SPAN.split(text.strip())
+    return "".join(p if i % 2 else _WHITESPACE.sub(" ", p).lower() for i, p in enumerate(parts))
+
+
 @app.post("/api/chat")
 async def chat_endpoint(req: ChatRequest):
     """
@@ -223,20 +468,37 @@ async def chat_endpoint(req: ChatRequest):
         # Build context from project data
         context = ""
         if req.project_id:
-            context = _build_project_context(req.project_id)
+            context = await _build_project_context(req.project_id)
 
         # Prepare messages: inject context into first user message
         messages = [{"role": m.role, "content": m.content} for m in req.messages]
         if context and messages:
             messages[0]["content"] = f"{context}\n\nUser question: {messages[0]['content']}"
 
-        # Classify intent and route to appropriate model
         user_query = req.messages[-1].content if req.messages else ""
-        intent = model_router.classify_intent(user_query)
+
+        # Opening questions are answered from the context alone, so a
+        # paraphrase of one already answered against the same context can
+        # reuse that answer (skipping intent classification too)
+        similar_scope = None
+        if len(req.messages) == 1:
+            similar_scope = llm_cache_key("chat", context)
+            cached = get_similar_llm(similar_scope, user_query)
+            if cached is not None:
+                return cached
+
+        # Classify intent and route to appropriate model
+        intent = await _classify_intent(user_query)
         task = model_router.task_for_intent(intent)
 
-        response = model_router.generate(task, messages)
-        return {
+        cache_key = llm_cache_key(task.value, *(
+            f"{m['role']}:{_normalize_for_cache(m['content'])}" for m in messages
+        ))
+        response = get_cached_llm(cache_key)
+        if response is None:
+            response = await _llm_generate(task, messages)
+            set_cached_llm(cache_key, response)
+        reply = {
             "role": "assistant",
             "content": response,
             "meta": {
@@ -245,6 +507,9 @@ async def chat_endpoint(req: ChatRequest):
                 "model": "multi-model-router",
             },
         }
+        if similar_scope:
+            set_similar_llm(similar_scope, user_query, reply)
+        return reply
 
     except Exception as e:
         logger.error(f"Chat error: {e}")
@@ -260,7 +525,7 @@ async def chat_stream_endpoint(req: ChatRequest):
     try:
         context = ""
         if req.project_id:
-            context = _build_project_context(req.project_id)
+            context = await _build_project_context(req.project_id)
 
         messages = [{"role": m.role, "content": m.content} for m in req.messages]
         if context and messages:
@@ -268,22 +533,11 @@ async def chat_stream_endpoint(req: ChatRequest):
 
         # Classify intent for task-specific model
         user_query = req.messages[-1].content if req.messages else ""
-        intent = model_router.classify_intent(user_query)
+        intent = await _classify_intent(user_query)
         task = model_router.task_for_intent(intent)
 
-        def generate():
-            try:
-                # Send metadata as first event
-                import json
-                meta = json.dumps({"intent": intent, "task_type": task.value})
-                yield f"data: [META]{meta}\n\n"
-                for token in model_router.stream(task, messages):
-                    yield f"data: {token}\n\n"
-                yield "data: [DONE]\n\n"
-            except Exception as e:
-                yield f"data: [ERROR] {str(e)}\n\n"
-
-        return StreamingResponse(generate(), media_type="text/event-stream")
+        meta = {"intent": intent, "task_type": task.value}
+        return _sse_response(task, messages, meta)
 
     except Exception as e:
         logger.error(f"Chat stream error: {e}")
@@ -310,7 +564,7 @@ async def get_role_dashboard(role: str):
 async def list_system_users():
     """Return all system users (for role selector)."""
     try:
-        records, _ = neo4j_client.execute_query(
+        records, _ = await neo4j_client.execute_query_async(
             "MATCH (su:SystemUser) RETURN su { .* } as user ORDER BY su.role"
         )
         return [dict(r["user"]) for r in records]
@@ -323,7 +577,7 @@ async def list_system_users():
 async def get_system_user(user_id: str):
     """Get a specific system user."""
     try:
-        records, _ = neo4j_client.execute_query(
+        records, _ = await neo4j_client.execute_query_async(
             "MATCH (su:SystemUser {id: $id}) RETURN su { .* } as user",
             {"id": user_id},
         )
@@ -337,6 +591,77 @@ async def get_system_user(user_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Dashboard queries are module constants so every request sends the
+# identical statement text and Neo4j reuses the cached plan.
+DASHBOARD_ENGINEER_QUERY = """
+    MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
+    OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+    OPTIONAL MATCH (tk)<-[:ASSIGNED_TO]-(m:Member)
+    WITH t, p, collect(DISTINCT tk { .*, assignee: m.name }) as tickets
+    RETURN t.name as team, t.id as team_id, p { .* } as project, tickets
+    ORDER BY t.name, p.name
+"""
+
+DASHBOARD_HR_QUERY = """
+    MATCH (m:Member)
+    CALL {
+        WITH m
+        OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
+        WHERE tk.status <> 'Done'
+        RETURN count(tk) as active_tickets
+    }
+    OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
+    RETURN m { .* } as member, t.name as team, active_tickets
+    ORDER BY active_tickets DESC
+"""
+
+DASHBOARD_CHAIRPERSON_QUERY = """
+    MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
+    OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+    WHERE tk.status <> 'Done'
+    OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
+    WHERE blocker.status <> 'Done'
+    RETURN t.name as team, t.id as team_id, p { .* } as project,
+           count(DISTINCT tk) as active_tickets,
+           count(DISTINCT blocker) as blocked_count
+    ORDER BY count(DISTINCT blocker) DESC
+"""
+
+DASHBOARD_FINANCE_TEAMS_QUERY = """
+    MATCH (t:Team)
+    OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
+    OPTIONAL MATCH (t)-[:HAS_PROJECT]->(p:Project)
+    OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+    WHERE tk.status <> 'Done'
+    OPTIONAL MATCH (p)-[:HAS_TICKET]->(done:Ticket)
+    WHERE done.status = 'Done'
+    RETURN t { .* } as team,
+           count(DISTINCT m) as member_count,
+           count(DISTINCT p) as project_count,
+           count(DISTINCT tk) as active_ticket_count,
+           count(DISTINCT done) as done_ticket_count
+"""
+
+DASHBOARD_FINANCE_PROJECTS_QUERY = """
+    MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
+    OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+    WHERE tk.status <> 'Done'
+    OPTIONAL MATCH (p)-[:HAS_TICKET]->(done:Ticket)
+    WHERE done.status = 'Done'
+    OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
+    WHERE blocker.status <> 'Done'
+    OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
+    WITH p, t, tk, done, blocker, m
+    OPTIONAL MATCH (t)-[:HAS_PROJECT]->(tp:Project)
+    RETURN p { .* } as project, t.name as team,
+           count(DISTINCT tk) as active_tickets,
+           count(DISTINCT done) as done_tickets,
+           count(DISTINCT blocker) as blocked_count,
+           count(DISTINCT m) as team_size,
+           count(DISTINCT tp) as project_count
+"""
+
+
 @app.get("/api/dashboard/{role}")
 async def get_dashboard_data(role: str):
     """
@@ -354,14 +679,7 @@ async def get_dashboard_data(role: str):
 
         if role == "engineer":
             # Team tickets & project progress
-            records, _ = neo4j_client.execute_query("""
-                MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
-                OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-                OPTIONAL MATCH (tk)<-[:ASSIGNED_TO]-(m:Member)
-                WITH t, p, collect(DISTINCT tk { .*, assignee: m.name }) as tickets
-                RETURN t.name as team, t.id as team_id, p { .* } as project, tickets
-                ORDER BY t.name, p.name
-            """)
+            records, _ = await neo4j_client.execute_query_async(DASHBOARD_ENGINEER_QUERY)
             projects = []
             for r in records:
                 proj = dict(r["project"]) if r["project"] else {}
@@ -373,15 +691,7 @@ async def get_dashboard_data(role: str):
 
         elif role == "hr":
             # All members + ticket counts (workload)
-            records, _ = neo4j_client.execute_query("""
-                MATCH (m:Member)
-                OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
-                WHERE tk.status <> 'Done'
-                OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
-                RETURN m { .* } as member, t.name as team,
-                       count(tk) as active_tickets
-                ORDER BY count(tk) DESC
-            """)
+            records, _ = await neo4j_client.execute_query_async(DASHBOARD_HR_QUERY)
             members = []
             for r in records:
                 mem = dict(r["member"])
@@ -392,17 +702,7 @@ async def get_dashboard_data(role: str):
 
         elif role == "chairperson":
             # All projects with risk overview
-            records, _ = neo4j_client.execute_query("""
-                MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
-                OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-                WHERE tk.status <> 'Done'
-                OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
-                WHERE blocker.status <> 'Done'
-                RETURN t.name as team, t.id as team_id, p { .* } as project,
-                       count(DISTINCT tk) as active_tickets,
-                       count(DISTINCT blocker) as blocked_count
-                ORDER BY count(DISTINCT blocker) DESC
-            """)
+            records, _ = await neo4j_client.execute_query_async(DASHBOARD_CHAIRPERSON_QUERY)
             projects = []
             for r in records:
                 proj = dict(r["project"]) if r["project"] else {}
@@ -415,28 +715,14 @@ async def get_dashboard_data(role: str):
 
         elif role == "finance":
             # Decision Economics: cost-impact modeling, risk-adjusted cost exposure
-            from .core.constants import INTERVENTION_IMPACTS
-
-            # Average cost per member per day (enterprise assumption)
-            AVG_DAILY_COST = 180  # USD/day per member
-            AVG_TICKET_REVENUE_UNIT = 8000  # estimated revenue per delivered ticket
-            BASE_REVENUE_PER_MEMBER = 3000  # base monthly revenue contribution per member
-
-            # 1. Team resource data
-            records, _ = neo4j_client.execute_query("""
-                MATCH (t:Team)
-                OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
-                OPTIONAL MATCH (t)-[:HAS_PROJECT]->(p:Project)
-                OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-                WHERE tk.status <> 'Done'
-                OPTIONAL MATCH (p)-[:HAS_TICKET]->(done:Ticket)
-                WHERE done.status = 'Done'
-                RETURN t { .* } as team,
-                       count(DISTINCT m) as member_count,
-                       count(DISTINCT p) as project_count,
-                       count(DISTINCT tk) as active_ticket_count,
-                       count(DISTINCT done) as done_ticket_count
-            """)
+            # (cost/revenue assumptions live in core.constants)
+            # Team resource data and per-project cost exposure are
+            # independent queries — run them concurrently
+            (records, _), (proj_records, _) = await asyncio.gather(
+                neo4j_client.execute_query_async(DASHBOARD_FINANCE_TEAMS_QUERY),
+                neo4j_client.execute_query_async(DASHBOARD_FINANCE_PROJECTS_QUERY),
+            )
+
             teams = []
             total_active_tickets = 0
             for r in records:
@@ -463,25 +749,6 @@ async def get_dashboard_data(role: str):
             data["teams"] = teams
             data["intervention_costs"] = INTERVENTION_IMPACTS
 
-            # 2. Per-project cost exposure + ROI analysis
-            proj_records, _ = neo4j_client.execute_query("""
-                MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
-                OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-                WHERE tk.status <> 'Done'
-                OPTIONAL MATCH (p)-[:HAS_TICKET]->(done:Ticket)
-                WHERE done.status = 'Done'
-                OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
-                WHERE blocker.status <> 'Done'
-                OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
-                WITH p, t, tk, done, blocker, m
-                OPTIONAL MATCH (t)-[:HAS_PROJECT]->(tp:Project)
-                RETURN p { .* } as project, t.name as team,
-                       count(DISTINCT tk) as active_tickets,
-                       count(DISTINCT done) as done_tickets,
-                       count(DISTINCT blocker) as blocked_count,
-                       count(DISTINCT m) as team_size,
-                       count(DISTINCT tp) as project_count
-            """)
             cost_analysis = []
             for r in proj_records:
                 proj = dict(r["project"]) if r["project"] else {}
@@ -538,6 +805,44 @@ async def get_dashboard_data(role: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+GRAPH_DATA_QUERY = """
+    CALL {
+        MATCH (n)
+        WHERE n:Team OR n:Project OR n:Ticket OR n:Member OR n:SystemUser
+        RETURN collect({
+            neo_id: id(n),
+            id: coalesce(n.id, elementId(n)),
+            label: labels(n)[0],
+            name: coalesce(n.name, n.title, n.id, ''),
+            props: n { .* }
+        }) AS nodes
+    }
+    CALL {
+        MATCH (a)-[r]->(b)
+        WHERE (a:Team OR a:Project OR a:Ticket OR a:Member OR a:SystemUser)
+          AND (b:Team OR b:Project OR b:Ticket OR b:Member OR b:SystemUser)
+        RETURN collect({
+            source: coalesce(a.id, elementId(a)),
+            target: coalesce(b.id, elementId(b)),
+            type: type(r)
+        }) AS edges
+    }
+    RETURN nodes, edges
+"""
+
+
+@swr_cache(ttl=30, stale=120)
+async def _build_graph_data() -> Dict[str, Any]:
+    """Every node and relationship for the graph page (shared, read-only)."""
+    # Nodes and edges in one statement; edge endpoints are resolved to
+    # the same id the node carries (its id property, else its elementId,
+    # which unlike the legacy id() is not reused after deletes).
+    records, _ = await neo4j_client.execute_query_async(GRAPH_DATA_QUERY)
+    # Rows already have their final shape; no per-node copy in Python
+    graph = records[0] if records else {}
+    return {"nodes": graph.get("nodes") or [], "edges": graph.get("edges") or []}
+
+
 @app.get("/api/graph")
 async def get_graph_data():
     """
@@ -545,42 +850,11 @@ async def get_graph_data():
     Returns { nodes: [...], edges: [...] }
     """
     try:
-        # ── Nodes ──
-        node_records, _ = neo4j_client.execute_query("""
-            MATCH (n)
-            WHERE n:Team OR n:Project OR n:Ticket OR n:Member OR n:SystemUser
-            RETURN id(n) AS neo_id,
-                   labels(n)[0] AS label,
-                   n { .* } AS props
-        """)
-        nodes = []
-        for r in node_records:
-            props = dict(r["props"]) if r["props"] else {}
-            nodes.append({
-                "neo_id": r["neo_id"],
-                "id": props.get("id", str(r["neo_id"])),
-                "label": r["label"],
-                "name": props.get("name") or props.get("title") or props.get("id", ""),
-                "props": props,
-            })
-
-        # ── Edges ──
-        edge_records, _ = neo4j_client.execute_query("""
-            MATCH (a)-[r]->(b)
-            WHERE (a:Team OR a:Project OR a:Ticket OR a:Member OR a:SystemUser)
-              AND (b:Team OR b:Project OR b:Ticket OR b:Member OR b:SystemUser)
-            RETURN id(a) AS source_neo, id(b) AS target_neo, type(r) AS rel_type
-        """)
-        # build neo_id -> id map
-        neo_map = {n["neo_id"]: n["id"] for n in nodes}
-        edges = []
-        for r in edge_records:
-            src = neo_map.get(r["source_neo"])
-            tgt = neo_map.get(r["target_neo"])
-            if src and tgt:
-                edges.append({"source": src, "target": tgt, "type": r["rel_type"]})
-
-        return {"nodes": nodes, "edges": edges}
+        graph = await _build_graph_data()
+        return StreamingResponse(
+            _iter_graph_json(graph["nodes"], graph["edges"]),
+            media_type="application/json",
+        )
     except Exception as e:
         logger.error(f"Graph data error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -590,6 +864,143 @@ async def get_graph_data():
 # Company-wide Report (Chairperson)
 # ============================================================================
 
+# Static instructions go first so the provider can reuse the cached prefix;
+# the live Neo4j data is always appended last as the user message.
+COMPANY_REPORT_INSTRUCTIONS = """You are a chief strategy officer producing a company analysis report for the board. Be thorough, data-driven, and strategic.
+
+Generate a comprehensive COMPANY ANALYSIS REPORT based on the live organizational data provided by the user.
+Use ONLY the provided data — do NOT invent information.
+
+Format the report with these sections:
+1. **Executive Summary** — 3-4 sentence overview of company health
+2. **Team Performance** — analysis of each team's delivery velocity and bottlenecks
+3. **Project Status Overview** — table/list of all projects with risk assessment
+4. **Workforce Analysis** — workload distribution, burnout risks, utilization
+5. **Risk & Blockers** — critical blocked items and dependency chains
+6. **Financial Impact** — cost implications of current trajectory (assume $450/member/day)
+7. **Strategic Recommendations** — ranked list of 5 actionable items
+8. **90-Day Outlook** — projected trajectory if current trends continue
+
+Use markdown formatting with headers, bullet points, and bold for key metrics.
+Be data-driven, strategic, and actionable."""
+
+
+@swr_cache(ttl=30, stale=120)
+async def _build_company_report_data() -> Dict[str, Any]:
+    """
+    Gather the company-wide report data from Neo4j.
+    Shared by the /api/company-report handler and the LLM report generators.
+    """
+    # 1. All teams with projects and ticket stats, aggregated per team and
+    #    then company-wide in Cypher (one row back)
+    teams_query = """
+        MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
+        OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
+        WITH t, p, count(DISTINCT m) as team_members
+        // One HAS_TICKET expansion; active/done/blocked via conditional counts
+        OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+        OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
+        WHERE blocker.status <> 'Done'
+        WITH t, p, team_members,
+             count(DISTINCT CASE WHEN tk.status <> 'Done' THEN tk END) as active,
+             count(DISTINCT CASE WHEN tk.status = 'Done' THEN tk END) as done,
+             count(DISTINCT CASE WHEN blocker IS NOT NULL THEN tk END) as blocked
+        ORDER BY p.name
+        WITH t, team_members,
+             collect(p { .*, active_tickets: active, done_tickets: done, blocked_count: blocked }) as projects,
+             sum(active) as total_active,
+             sum(done) as total_done,
+             sum(blocked) as total_blocked,
+             count(p) as project_count,
+             sum(coalesce(p.progress, 0)) as progress_sum
+        ORDER BY t.name
+        RETURN collect({
+                   team: t { .* }, team_members: team_members, projects: projects,
+                   total_active: total_active, total_done: total_done, total_blocked: total_blocked
+               }) as teams,
+               sum(total_active) as total_active,
+               sum(total_done) as total_done,
+               sum(total_blocked) as total_blocked,
+               sum(project_count) as total_projects,
+               sum(progress_sum) as progress_sum
+    """
+    # 2. Workforce summary, with overloaded/idle counts taken in the same
+    #    aggregation (one row back)
+    workforce_query = """
+        MATCH (m:Member)
+        CALL {
+            WITH m
+            OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
+            WHERE tk.status <> 'Done'
+            RETURN count(tk) as active_tickets
+        }
+        OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
+        WITH m, t, active_tickets
+        ORDER BY active_tickets DESC
+        RETURN collect({
+                   name: m.name, role: m.role, team: t.name, active_tickets: active_tickets
+               }) as workforce,
+               sum(CASE WHEN active_tickets >= 3 THEN 1 ELSE 0 END) as overloaded,
+               sum(CASE WHEN active_tickets = 0 THEN 1 ELSE 0 END) as idle
+    """
+    # The two queries are independent, so run them concurrently
+    (records, _), (wf_records, _) = await asyncio.gather(
+        neo4j_client.execute_query_async(teams_query),
+        neo4j_client.execute_query_async(workforce_query),
+    )
+
+    totals = records[0] if records else {}
+    total_active = totals.get("total_active") or 0
+    total_done = totals.get("total_done") or 0
+    total_blocked = totals.get("total_blocked") or 0
+    total_projects = totals.get("total_projects") or 0
+    progress_sum = totals.get("progress_sum") or 0
+
+    teams_map: Dict[str, Dict[str, Any]] = {}
+    all_projects = []
+    for r in totals.get("teams") or []:
+        team = r["team"] or {}
+        tid = team.get("id", "unknown")
+        projects = [
+            {**proj, "team": team.get("name"), "team_id": tid}
+            for proj in r["projects"]
+        ]
+        teams_map[tid] = {
+            **team,
+            "member_count": r["team_members"],
+            "projects": projects,
+            "total_active": r["total_active"],
+            "total_done": r["total_done"],
+            "total_blocked": r["total_blocked"],
+        }
+        all_projects.extend(projects)
+
+    wf = wf_records[0] if wf_records else {}
+    workforce = wf.get("workforce") or []
+
+    # 3. Aggregated stats
+    avg_progress = round(progress_sum / total_projects, 1) if total_projects else 0.0
+    completion_rate = round((total_done / max(total_active + total_done, 1)) * 100, 1)
+
+    return {
+        "teams": list(teams_map.values()),
+        "projects": all_projects,
+        "workforce": workforce,
+        "summary": {
+            "total_teams": len(teams_map),
+            "total_members": len(workforce),
+            "total_projects": total_projects,
+            "total_active_tickets": total_active,
+            "total_done_tickets": total_done,
+            "total_blocked": total_blocked,
+            "avg_progress": avg_progress,
+            "completion_rate": completion_rate,
+            "overloaded_members": wf.get("overloaded") or 0,
+            "idle_members": wf.get("idle") or 0,
+        },
+    }
+
+
 @app.get("/api/company-report")
 async def get_company_report():
     """
@@ -597,191 +1008,103 @@ async def get_company_report():
     Used by chairperson for report generation.
     """
     try:
-        # 1. All teams with projects and ticket stats
-        records, _ = neo4j_client.execute_query("""
-            MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
-            OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
-            WITH t, p, collect(DISTINCT m) as members
-            OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-            WHERE tk.status <> 'Done'
-            WITH t, p, members, collect(DISTINCT tk) as active_tks
-            OPTIONAL MATCH (p)-[:HAS_TICKET]->(done:Ticket)
-            WHERE done.status = 'Done'
-            WITH t, p, members, active_tks, collect(DISTINCT done) as done_tks
-            OPTIONAL MATCH (p)-[:HAS_TICKET]->(blocked:Ticket)<-[:BLOCKED_BY]-(blocker:Ticket)
-            WHERE blocker.status <> 'Done'
-            WITH t, p, members, active_tks, done_tks, count(DISTINCT blocked) as blocked_count
-            RETURN t { .* } as team,
-                   p { .* } as project,
-                   size(members) as team_members,
-                   size(active_tks) as active_tickets,
-                   size(done_tks) as done_tickets,
-                   blocked_count
-            ORDER BY t.name, p.name
-        """)
-
-        teams_map: Dict[str, Dict[str, Any]] = {}
-        all_projects = []
-        for r in records:
-            team = dict(r["team"]) if r["team"] else {}
-            proj = dict(r["project"]) if r["project"] else {}
-            tid = team.get("id", "unknown")
-
-            if tid not in teams_map:
-                team_entry: Dict[str, Any] = {
-                    **team,
-                    "member_count": r["team_members"],
-                    "projects": [],
-                    "total_active": 0,
-                    "total_done": 0,
-                    "total_blocked": 0,
-                }
-                teams_map[tid] = team_entry
-
-            proj_data = {
-                **proj,
-                "team": team.get("name"),
-                "team_id": tid,
-                "active_tickets": r["active_tickets"],
-                "done_tickets": r["done_tickets"],
-                "blocked_count": r["blocked_count"],
-            }
-            teams_map[tid]["projects"].append(proj_data)
-            teams_map[tid]["total_active"] += r["active_tickets"]
-            teams_map[tid]["total_done"] += r["done_tickets"]
-            teams_map[tid]["total_blocked"] += r["blocked_count"]
-            all_projects.append(proj_data)
-
-        # 2. Workforce summary
-        mem_records, _ = neo4j_client.execute_query("""
-            MATCH (m:Member)
-            OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
-            WHERE tk.status <> 'Done'
-            OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
-            RETURN m.name as name, m.role as role, t.name as team,
-                   count(tk) as active_tickets
-            ORDER BY count(tk) DESC
-        """)
-        workforce = [dict(r) for r in mem_records]
-        overloaded = [w for w in workforce if w["active_tickets"] >= 3]
-        idle = [w for w in workforce if w["active_tickets"] == 0]
-
-        # 3. Aggregated stats
-        total_members = len(workforce)
-        total_projects = len(all_projects)
-        total_active = sum(p["active_tickets"] for p in all_projects)
-        total_done = sum(p["done_tickets"] for p in all_projects)
-        total_blocked = sum(p["blocked_count"] for p in all_projects)
-        avg_progress = round(sum(p.get("progress", 0) for p in all_projects) / max(total_projects, 1), 1)
-        completion_rate = round((total_done / max(total_active + total_done, 1)) * 100, 1)
-
-        return {
-            "teams": list(teams_map.values()),
-            "projects": all_projects,
-            "workforce": workforce,
-            "summary": {
-                "total_teams": len(teams_map),
-                "total_members": total_members,
-                "total_projects": total_projects,
-                "total_active_tickets": total_active,
-                "total_done_tickets": total_done,
-                "total_blocked": total_blocked,
-                "avg_progress": avg_progress,
-                "completion_rate": completion_rate,
-                "overloaded_members": len(overloaded),
-                "idle_members": len(idle),
-            },
-        }
+        return await _build_company_report_data()
     except Exception as e:
         logger.error(f"Company report error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/company-report/generate")
-async def generate_company_report():
-    """
-    Generate a full AI-powered company analysis report using LLM.
-    Returns structured markdown report.
-    """
-    try:
-        # Get company data
-        report_data = await get_company_report()
-        summary = report_data["summary"]
-        teams = report_data["teams"]
-        projects = report_data["projects"]
-        workforce = report_data["workforce"]
-
-        # Build context for LLM
-        teams_ctx = "\n".join([
+# Last report data and its messages. The SWR cache hands out the same data
+# object until it refreshes, so an identity check is enough to reuse them.
+_report_messages_memo: Dict[str, Any] = {"data": None, "messages": None}
+
+
+def _build_company_report_messages(report_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Turn company-report data into LLM messages (static instructions first)."""
+    if _report_messages_memo["data"] is report_data:
+        return _report_messages_memo["messages"]
+
+    summary = report_data["summary"]
+    teams = report_data["teams"]
+    projects = report_data["projects"]
+    workforce = report_data["workforce"]
+
+    # Build the whole prompt as one list of lines and join once
+    lines = [
+        "COMPANY OVERVIEW:",
+        f"  Teams: {summary['total_teams']}",
+        f"  Total Members: {summary['total_members']}",
+        f"  Total Projects: {summary['total_projects']}",
+        f"  Active Tickets: {summary['total_active_tickets']}",
+        f"  Completed Tickets: {summary['total_done_tickets']}",
+        f"  Blocked Items: {summary['total_blocked']}",
+        f"  Average Progress: {summary['avg_progress']}%",
+        f"  Completion Rate: {summary['completion_rate']}%",
+        f"  Overloaded Members: {summary['overloaded_members']}",
+        f"  Idle Members: {summary['idle_members']}",
+        "",
+        "TEAMS:",
+    ]
+    append = lines.append
+    for t in teams:
+        append(
             f"  - {t.get('name')}: {t.get('member_count')} members, "
             f"{len(t.get('projects', []))} projects, "
             f"{t.get('total_active')} active tickets, "
             f"{t.get('total_done')} completed, "
             f"{t.get('total_blocked')} blocked"
-            for t in teams
-        ])
+        )
 
-        projects_ctx = "\n".join([
+    append("")
+    append("PROJECTS:")
+    for p in projects:
+        append(
             f"  - {p.get('name')} ({p.get('team')}): {p.get('status')}, "
             f"{p.get('progress', 0)}% done, "
             f"{p.get('active_tickets')} active, "
             f"{p.get('done_tickets')} done, "
             f"{p.get('blocked_count')} blocked"
-            for p in projects
-        ])
-
-        overloaded_ctx = "\n".join([
-            f"  - {w['name']} ({w.get('role')}, {w.get('team')}): {w['active_tickets']} active tickets"
-            for w in workforce if w["active_tickets"] >= 3
-        ]) or "  None"
-
-        prompt = f"""Generate a comprehensive COMPANY ANALYSIS REPORT based on the following live organizational data.
-Use ONLY the provided data — do NOT invent information.
-
-COMPANY OVERVIEW:
-  Teams: {summary['total_teams']}
-  Total Members: {summary['total_members']}
-  Total Projects: {summary['total_projects']}
-  Active Tickets: {summary['total_active_tickets']}
-  Completed Tickets: {summary['total_done_tickets']}
-  Blocked Items: {summary['total_blocked']}
-  Average Progress: {summary['avg_progress']}%
-  Completion Rate: {summary['completion_rate']}%
-  Overloaded Members: {summary['overloaded_members']}
-  Idle Members: {summary['idle_members']}
-
-TEAMS:
-{teams_ctx}
-
-PROJECTS:
-{projects_ctx}
+        )
 
-OVERLOADED MEMBERS (3+ tickets):
-{overloaded_ctx}
+    append("")
+    append("OVERLOADED MEMBERS (3+ tickets):")
+    header_len = len(lines)
+    for w in workforce:
+        if w["active_tickets"] >= 3:
+            append(f"  - {w['name']} ({w.get('role')}, {w.get('team')}): {w['active_tickets']} active tickets")
+    if len(lines) == header_len:
+        append("  None")
+    append("")
+    prompt = "\n".join(lines)
+
+    messages = [
+        {"role": "system", "content": COMPANY_REPORT_INSTRUCTIONS},
+        {"role": "user", "content": prompt},
+    ]
+    _report_messages_memo.update(data=report_data, messages=messages)
+    return messages
 
-Format the report with these sections:
-1. **Executive Summary** — 3-4 sentence overview of company health
-2. **Team Performance** — analysis of each team's delivery velocity and bottlenecks
-3. **Project Status Overview** — table/list of all projects with risk assessment
-4. **Workforce Analysis** — workload distribution, burnout risks, utilization
-5. **Risk & Blockers** — critical blocked items and dependency chains
-6. **Financial Impact** — cost implications of current trajectory (assume $450/member/day)
-7. **Strategic Recommendations** — ranked list of 5 actionable items
-8. **90-Day Outlook** — projected trajectory if current trends continue
 
-Use markdown formatting with headers, bullet points, and bold for key metrics.
-Be data-driven, strategic, and actionable.
-"""
+@app.post("/api/company-report/generate")
+async def generate_company_report():
+    """
+    Generate a full AI-powered company analysis report using LLM.
+    Returns structured markdown report.
+    """
+    try:
+        report_data = await _build_company_report_data()
+        messages = _build_company_report_messages(report_data)
 
-        report_text = model_router.generate(
-            TaskType.EXPLANATION,
-            [{"role": "system", "content": "You are a chief strategy officer producing a company analysis report for the board. Be thorough, data-driven, and strategic."},
-             {"role": "user", "content": prompt}],
-        )
+        # Same company data → same report; skip the LLM call
+        cache_key = llm_cache_key("company-report", messages[-1]["content"])
+        report_text = get_cached_llm(cache_key)
+        if report_text is None:
+            report_text = await _llm_generate(TaskType.EXPLANATION, messages, priority="low")
+            set_cached_llm(cache_key, report_text)
 
         return {
             "report": report_text,
-            "summary": summary,
+            "summary": report_data["summary"],
             "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
         }
     except Exception as e:
@@ -789,50 +1112,90 @@ Be data-driven, strategic, and actionable.
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/company-report/generate/stream")
+async def generate_company_report_stream():
+    """
+    Streaming company report — same prompt as /generate, but returns SSE
+    tokens as they are generated so the report renders progressively.
+    """
+    try:
+        report_data = await _build_company_report_data()
+        meta = {
+            "summary": report_data["summary"],
+            "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        return _sse_response(TaskType.EXPLANATION, _build_company_report_messages(report_data), meta, "low")
+    except Exception as e:
+        logger.error(f"Company report stream error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # Risk History / Trend Tracking
 # ============================================================================
 
+# Writes a snapshot only when score or counts moved since the project's
+# latest one; otherwise returns that latest snapshot unchanged.
+RISK_SNAPSHOT_QUERY = """
+    MATCH (p:Project {id: $pid})
+    OPTIONAL MATCH (prev:RiskSnapshot)
+    WHERE prev.project_id = $pid AND prev.timestamp IS NOT NULL
+    WITH p, prev
+    ORDER BY prev.timestamp DESC
+    LIMIT 1
+    WITH p, prev,
+         prev IS NOT NULL
+         AND abs(prev.risk_score - $score) < 0.001
+         AND prev.blocked_count = $blocked
+         AND prev.overdue_count = $overdue AS unchanged
+    FOREACH (_ IN CASE WHEN unchanged THEN [] ELSE [1] END |
+        CREATE (p)-[:HAS_SNAPSHOT]->(:RiskSnapshot {
+            project_id: $pid,
+            project_name: $pname,
+            risk_score: $score,
+            risk_level: $level,
+            blocked_count: $blocked,
+            overdue_count: $overdue,
+            total_tickets: $total,
+            timestamp: $ts
+        })
+    )
+    RETURN unchanged, prev { .* } AS previous
+"""
+
+
 @app.post("/api/risk-snapshot/{project_id}")
 async def save_risk_snapshot(project_id: str):
     """
     Run risk analysis and persist a snapshot node in Neo4j.
-    Returns the snapshot.
+    Returns the snapshot, or the latest stored one if score and counts
+    haven't changed since it was taken.
     """
     try:
-        result = risk_agent.analyze(project_id)
-
-        # Count blocked & overdue from supporting_signals
-        blocked = sum(1 for s in result.supporting_signals if "blocked" in s.lower())
-        overdue = sum(1 for s in result.supporting_signals if "overdue" in s.lower())
+        result = await _analyze_risk(project_id)
+
+        # Count blocked & overdue from supporting_signals in a single pass
+        blocked = overdue = 0
+        for signal in result.supporting_signals:
+            low = signal.lower()
+            blocked += "blocked" in low
+            overdue += "overdue" in low
         total = len(result.supporting_signals)
 
+        # Scores are quantized so float drift between runs doesn't count as a change
         snapshot = RiskSnapshot(
             project_id=project_id,
             project_name=result.project_name,
-            risk_score=result.risk_score,
+            risk_score=round(result.risk_score, 2),
             risk_level=result.risk_level,
             blocked_count=blocked,
             overdue_count=overdue,
             total_tickets=total,
         )
 
-        # Persist to Neo4j
-        neo4j_client.execute_query(
-            """
-            MATCH (p:Project {id: $pid})
-            CREATE (s:RiskSnapshot {
-                project_id: $pid,
-                project_name: $pname,
-                risk_score: $score,
-                risk_level: $level,
-                blocked_count: $blocked,
-                overdue_count: $overdue,
-                total_tickets: $total,
-                timestamp: $ts
-            })
-            CREATE (p)-[:HAS_SNAPSHOT]->(s)
-            """,
+        # Persist to Neo4j (skipped when nothing changed since the last snapshot)
+        records, _ = await neo4j_client.execute_query_async(
+            RISK_SNAPSHOT_QUERY,
             {
                 "pid": snapshot.project_id,
                 "pname": snapshot.project_name,
@@ -844,6 +1207,8 @@ async def save_risk_snapshot(project_id: str):
                 "ts": snapshot.timestamp,
             },
         )
+        if records and records[0]["unchanged"]:
+            return dict(records[0]["previous"])
 
         return snapshot.model_dump()
     except Exception as e:
@@ -851,53 +1216,92 @@ async def save_risk_snapshot(project_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+RISK_HISTORY_QUERY = """
+    MATCH (s:RiskSnapshot)
+    WHERE s.project_id = $pid AND s.timestamp IS NOT NULL
+    WITH s
+    ORDER BY s.timestamp DESC
+    LIMIT $lim
+    RETURN s { .* } as snapshot
+    ORDER BY s.timestamp
+"""
+
+
 @app.get("/api/risk-history/{project_id}")
 async def get_risk_history(project_id: str, limit: int = 30):
     """
-    Retrieve risk snapshots for a project, ordered by timestamp desc.
+    Retrieve the latest risk snapshots for a project in chronological order.
+    Anchored on the (project_id, timestamp) index so ORDER BY ... LIMIT is
+    served by a backward index scan instead of a sort; only the limited rows
+    are re-sorted ascending for charting.
     """
     try:
-        records, _ = neo4j_client.execute_query(
-            """
-            MATCH (p:Project {id: $pid})-[:HAS_SNAPSHOT]->(s:RiskSnapshot)
-            RETURN s { .* } as snapshot
-            ORDER BY s.timestamp DESC
-            LIMIT $lim
-            """,
+        records, _ = await neo4j_client.execute_query_async(
+            RISK_HISTORY_QUERY,
             {"pid": project_id, "lim": limit},
         )
-        snapshots = [dict(r["snapshot"]) for r in records]
-        snapshots.reverse()  # chronological order for charting
-        return snapshots
+        return [dict(r["snapshot"]) for r in records]
     except Exception as e:
         logger.error(f"Risk history error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# ============================================================================
-# Postmortem Generator
-# ============================================================================
+RISK_HISTORY_BATCH_QUERY = """
+    UNWIND $pids AS pid
+    CALL {
+        WITH pid
+        MATCH (s:RiskSnapshot)
+        WHERE s.project_id = pid AND s.timestamp IS NOT NULL
+        RETURN s
+        ORDER BY s.timestamp DESC
+        LIMIT $lim
+    }
+    WITH pid, s
+    ORDER BY s.timestamp
+    RETURN pid, collect(s { .* }) as snapshots
+"""
 
-@app.get("/api/postmortem/{project_id}")
-async def generate_postmortem(project_id: str):
+
+class RiskHistoryBatchRequest(BaseModel):
+    project_ids: List[str]
+    limit: int = 30
+
+
+@app.post("/api/risk-history/batch")
+async def get_risk_history_batch(req: RiskHistoryBatchRequest):
     """
-    Generate a structured postmortem report for a project using
-    risk analysis data + LLM reasoning.
+    Retrieve risk snapshots for several projects in one round-trip.
+    Returns { project_id: [snapshots in chronological order] }.
     """
     try:
-        # Get full analysis
-        result = risk_agent.analyze(project_id)
-
-        # Build evidence summary
-        signals = "\n".join([f"- {s}" for s in result.supporting_signals]) or "- No issues detected"
-        actions = "\n".join([f"- {a}" for a in result.recommended_actions]) or "- None"
-        decisions = "\n".join([
-            f"- {d.action}: risk_reduction={d.risk_reduction:.0%}, "
-            f"cost={d.cost}, feasible={d.feasible}, recommended={d.recommended}"
-            for d in result.decision_comparison
-        ])
-
-        prompt = f"""
+        records, _ = await neo4j_client.execute_query_async(
+            RISK_HISTORY_BATCH_QUERY,
+            {"pids": req.project_ids, "lim": req.limit},
+        )
+        history: Dict[str, List[dict]] = {pid: [] for pid in req.project_ids}
+        for r in records:
+            history[r["pid"]] = [dict(s) for s in r["snapshots"]]
+        return history
+    except Exception as e:
+        logger.error(f"Risk history batch error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ============================================================================
+# Postmortem Generator
+# ============================================================================
+
+def _build_postmortem_messages(result: AnalysisResult) -> List[Dict[str, str]]:
+    """Turn a risk analysis result into postmortem LLM messages."""
+    signals = "\n".join([f"- {s}" for s in result.supporting_signals]) or "- No issues detected"
+    actions = "\n".join([f"- {a}" for a in result.recommended_actions]) or "- None"
+    decisions = "\n".join([
+        f"- {d.action}: risk_reduction={d.risk_reduction:.0%}, "
+        f"cost={d.cost}, feasible={d.feasible}, recommended={d.recommended}"
+        for d in result.decision_comparison
+    ])
+
+    prompt = f"""
 Generate a structured POSTMORTEM report for this project.
 Use ONLY the evidence provided below — do NOT invent facts.
 
@@ -924,10 +1328,32 @@ Format the postmortem with these sections:
 
 Be direct, data-driven, and actionable.
 """
-        postmortem_text = model_router.generate(
-            TaskType.POSTMORTEM,
-            [{"role": "user", "content": prompt}],
-        )
+    return [{"role": "user", "content": prompt}]
+
+
+async def _project_risk(project_id: str):
+    """Risk analysis for a project from the shared risk cache (computed once per data version)."""
+    db_version = await asyncio.to_thread(get_cache_version)
+    return await get_or_compute_risk(project_id, _analyze_risk, db_version)
+
+
+@app.get("/api/postmortem/{project_id}")
+async def generate_postmortem(project_id: str):
+    """
+    Generate a structured postmortem report for a project using
+    risk analysis data + LLM reasoning.
+    """
+    try:
+        # Get full analysis
+        result = await _project_risk(project_id)
+        messages = _build_postmortem_messages(result)
+
+        # Same evidence → same postmortem; skip the LLM call
+        cache_key = llm_cache_key("postmortem", project_id, *(m["content"] for m in messages))
+        postmortem_text = get_cached_llm(cache_key)
+        if postmortem_text is None:
+            postmortem_text = await _llm_generate(TaskType.POSTMORTEM, messages, priority="low")
+            set_cached_llm(cache_key, postmortem_text)
 
         return {
             "project_id": result.project_id,
@@ -946,63 +1372,29 @@ Be direct, data-driven, and actionable.
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/narrative/{role}")
-async def get_narrative(role: str):
-    """
-    LLM-powered executive narrative for each role.
-    Reads real Neo4j data, runs it through the LLM for a plain-English intelligence briefing.
-    """
-    if role not in ROLE_DEFINITIONS:
-        raise HTTPException(status_code=404, detail=f"Role '{role}' not found")
-
+@app.get("/api/postmortem/{project_id}/stream")
+async def generate_postmortem_stream(project_id: str):
+    """Streaming postmortem — returns SSE tokens as they are generated."""
     try:
-        # Gather live data from Neo4j
-        context_parts = []
-
-        if role in ("chairperson", "engineer", "finance"):
-            records, _ = neo4j_client.execute_query("""
-                MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
-                OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-                OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
-                WHERE blocker.status <> 'Done'
-                RETURN p.name as project, p.status as status, p.progress as progress,
-                       t.name as team,
-                       count(DISTINCT tk) as tickets,
-                       count(DISTINCT blocker) as blockers
-            """)
-            context_parts.append("PROJECTS:\n" + "\n".join([
-                f"  - {r['project']} ({r['team']}): {r['status']}, {r['progress']}% done, {r['tickets']} tickets, {r['blockers']} blockers"
-                for r in records
-            ]))
-
-        if role in ("hr", "chairperson"):
-            records, _ = neo4j_client.execute_query("""
-                MATCH (m:Member)
-                OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
-                WHERE tk.status <> 'Done'
-                OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
-                RETURN m.name as name, m.role as role, t.name as team,
-                       count(tk) as active_tickets
-                ORDER BY count(tk) DESC
-            """)
-            overloaded = [r for r in records if r['active_tickets'] >= 3]
-            idle = [r for r in records if r['active_tickets'] == 0]
-            context_parts.append(
-                f"WORKFORCE ({len(records)} members, {len(overloaded)} overloaded, {len(idle)} idle):\n" +
-                "\n".join([f"  - {r['name']} ({r['role']}, {r['team']}): {r['active_tickets']} tickets" for r in records[:15]])
-            )
-
-        if role == "finance":
-            from .core.constants import INTERVENTION_IMPACTS
-            context_parts.append(
-                "INTERVENTIONS:\n" +
-                "\n".join([f"  - {action}: risk_reduction={v.get('risk_reduction','?')}, cost={v.get('cost_penalty','?')}" for action, v in INTERVENTION_IMPACTS.items()])
-            )
+        result = await _project_risk(project_id)
+        meta = {
+            "project_id": result.project_id,
+            "project_name": result.project_name,
+            "risk_score": result.risk_score,
+            "risk_level": result.risk_level,
+        }
+        messages = _build_postmortem_messages(result)
+        # Keyed apart from the non-stream postmortem: the entry is the token sequence
+        cache_key = llm_cache_key("postmortem-stream", project_id, *(m["content"] for m in messages))
+        return _sse_response(TaskType.POSTMORTEM, messages, meta, "low", cache_key)
+    except Exception as e:
+        logger.error(f"Postmortem stream error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        combined_context = "\n\n".join(context_parts)
 
-        role_prompts = {
-            "engineer": """You are a senior engineering lead and technical strategist. Based on the live project data below, produce a comprehensive intelligence briefing in clean Markdown with these sections:
+# Role system prompts are static — built once at import, read-only at runtime
+ROLE_PROMPTS: Mapping[str, str] = MappingProxyType({
+    "engineer": """You are a senior engineering lead and technical strategist. Based on the live project data below, produce a comprehensive intelligence briefing in clean Markdown with these sections:
 
 ## Critical Priorities
 Top 2-3 things engineers must address TODAY (blockers, overdue, high-priority tickets).
@@ -1018,7 +1410,7 @@ Any projects or tickets showing warning signs (blocked chains, unassigned work,
 
 Use bullet points, bold key metrics. Be direct and data-driven. Reference specific project names and ticket counts.""",
 
-            "hr": """You are an HR strategist and workforce analytics expert. Based on the live workforce data below, produce a comprehensive intelligence briefing in clean Markdown with these sections:
+    "hr": """You are an HR strategist and workforce analytics expert. Based on the live workforce data below, produce a comprehensive intelligence briefing in clean Markdown with these sections:
 
 ## Workforce Overview
 Team size, distribution, and utilization summary.
@@ -1037,7 +1429,7 @@ Based on workload patterns, suggest which roles to hire for.
 
 Use bullet points, bold key metrics. Reference specific names and numbers.""",
 
-            "chairperson": """You are a Chief Delivery Officer reporting to the board. Based on the live project and workforce data below, produce a strategic intelligence briefing in clean Markdown with these sections:
+    "chairperson": """You are a Chief Delivery Officer reporting to the board. Based on the live project and workforce data below, produce a strategic intelligence briefing in clean Markdown with these sections:
 
 ## Executive Summary
 3-sentence overview of organizational delivery health.
@@ -1059,7 +1451,7 @@ Overloaded members, staffing gaps, cross-team dependencies.
 
 Be data-driven, cite specific numbers, project names, and team names.""",
 
-            "finance": """You are a CFO and Finance Director. Based on the resource and cost data below, produce a financial intelligence briefing in clean Markdown with these sections:
+    "finance": """You are a CFO and Finance Director. Based on the resource and cost data below, produce a financial intelligence briefing in clean Markdown with these sections:
 
 ## Cost Overview
 Total burn rate, cost per team, cost per project.
@@ -1074,14 +1466,110 @@ Projects burning budget without proportional delivery. Quantify exposure.
 3 specific recommendations to reduce costs or improve ROI.
 
 Use dollar figures, percentages, and concrete metrics. Be analytical.""",
-        }
+})
 
-        messages = [
-            {"role": "system", "content": role_prompts.get(role, "Provide a comprehensive intelligence summary with clear sections, metrics, and actionable recommendations.")},
-            {"role": "user", "content": f"Here is the LIVE organizational data from our Neo4j knowledge graph:\n\n{combined_context}\n\nGenerate your full intelligence briefing now. Use ONLY the data provided — do NOT invent facts."},
-        ]
+DEFAULT_ROLE_PROMPT = "Provide a comprehensive intelligence summary with clear sections, metrics, and actionable recommendations."
 
-        narrative = model_router.generate(TaskType.SUMMARY, messages)
+
+NARRATIVE_PROJECTS_QUERY = """
+    MATCH (t:Team)-[:HAS_PROJECT]->(p:Project)
+    OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+    OPTIONAL MATCH (tk)<-[:BLOCKED_BY]-(blocker:Ticket)
+    WHERE blocker.status <> 'Done'
+    RETURN p.name as project, p.status as status, p.progress as progress,
+           t.name as team,
+           count(DISTINCT tk) as tickets,
+           count(DISTINCT blocker) as blockers
+"""
+
+
+NARRATIVE_WORKFORCE_QUERY = """
+    MATCH (m:Member)
+    CALL {
+        WITH m
+        OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
+        WHERE tk.status <> 'Done'
+        RETURN count(tk) as active_tickets
+    }
+    OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
+    WITH m, t, active_tickets
+    ORDER BY active_tickets DESC
+    RETURN collect({name: m.name, role: m.role, team: t.name,
+                    active_tickets: active_tickets})[0..$preview] as members,
+           count(*) as total,
+           sum(CASE WHEN active_tickets >= 3 THEN 1 ELSE 0 END) as overloaded,
+           sum(CASE WHEN active_tickets = 0 THEN 1 ELSE 0 END) as idle
+"""
+
+
+async def _build_narrative_messages(role: str) -> List[Dict[str, str]]:
+    """Gather live Neo4j data for a role and build the narrative LLM messages."""
+    # Gather live data from Neo4j — the per-role queries are independent,
+    # so fire them concurrently
+    want_projects = role in ("chairperson", "engineer", "finance")
+    want_workforce = role in ("hr", "chairperson")
+    queries = []
+    if want_projects:
+        queries.append(neo4j_client.execute_query_async(NARRATIVE_PROJECTS_QUERY))
+    if want_workforce:
+        # Overloaded / idle are classified in Cypher, returned as counts;
+        # only the 15 busiest members are shipped for the context preview
+        queries.append(neo4j_client.execute_query_async(NARRATIVE_WORKFORCE_QUERY, {"preview": 15}))
+    results = iter(await asyncio.gather(*queries))
+
+    # One flat list of lines, joined once; sections are separated by a blank line
+    lines: List[str] = []
+    append = lines.append
+
+    if want_projects:
+        records, _ = next(results)
+        append("PROJECTS:")
+        for r in records:
+            append(f"  - {r['project']} ({r['team']}): {r['status']}, {r['progress']}% done, {r['tickets']} tickets, {r['blockers']} blockers")
+
+    if want_workforce:
+        records, _ = next(results)
+        wf = records[0] if records else {"members": [], "total": 0, "overloaded": 0, "idle": 0}
+        if lines:
+            append("")
+        append(f"WORKFORCE ({wf['total']} members, {wf['overloaded']} overloaded, {wf['idle']} idle):")
+        for r in wf["members"]:
+            append(f"  - {r['name']} ({r['role']}, {r['team']}): {r['active_tickets']} tickets")
+
+    if role == "finance":
+        if lines:
+            append("")
+        append("INTERVENTIONS:")
+        for action, v in INTERVENTION_IMPACTS.items():
+            append(f"  - {action}: risk_reduction={v.get('risk_reduction','?')}, cost={v.get('cost_penalty','?')}")
+
+    combined_context = "\n".join(lines)
+
+    messages = [
+        {"role": "system", "content": ROLE_PROMPTS.get(role, DEFAULT_ROLE_PROMPT)},
+        {"role": "user", "content": f"Generate your full intelligence briefing now. Use ONLY the data provided — do NOT invent facts. Here is the LIVE organizational data from our Neo4j knowledge graph:\n\n{combined_context}"},
+    ]
+    return messages
+
+
+@app.get("/api/narrative/{role}")
+async def get_narrative(role: str):
+    """
+    LLM-powered executive narrative for each role.
+    Reads real Neo4j data, runs it through the LLM for a plain-English intelligence briefing.
+    """
+    if role not in ROLE_DEFINITIONS:
+        raise HTTPException(status_code=404, detail=f"Role '{role}' not found")
+
+    try:
+        messages = await _build_narrative_messages(role)
+
+        # Same role + same live data → same briefing; skip the LLM call
+        cache_key = llm_cache_key("narrative", role, *(m["content"] for m in messages))
+        narrative = get_cached_llm(cache_key)
+        if narrative is None:
+            narrative = await _llm_generate(TaskType.SUMMARY, messages, priority="low")
+            set_cached_llm(cache_key, narrative)
         return {"role": role, "narrative": narrative}
 
     except HTTPException:
@@ -1091,6 +1579,20 @@ Use dollar figures, percentages, and concrete metrics. Be analytical.""",
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/narrative/{role}/stream")
+async def get_narrative_stream(role: str):
+    """Streaming narrative — returns SSE tokens as they are generated."""
+    if role not in ROLE_DEFINITIONS:
+        raise HTTPException(status_code=404, detail=f"Role '{role}' not found")
+
+    try:
+        messages = await _build_narrative_messages(role)
+        return _sse_response(TaskType.SUMMARY, messages, {"role": role}, "low")
+    except Exception as e:
+        logger.error(f"Narrative stream error for {role}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # Team Composition Simulator
 # ============================================================================
@@ -1108,37 +1610,44 @@ async def simulate_team_changes(req: TeamSimulationRequest):
     Accepts hypothetical mutations and returns Monte Carlo projections.
     """
     try:
-        mutations = []
-        for m in req.mutations:
-            role = m.get("role", "Mid Engineer")
-            if role not in ROLE_PROFILES:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unknown role '{role}'. Available: {list(ROLE_PROFILES.keys())}",
-                )
-            mutations.append(TeamMutation(
+        profiles = ROLE_PROFILES
+        roles = [m.get("role", "Mid Engineer") for m in req.mutations]
+        unknown = next((role for role in roles if role not in profiles), None)
+        if unknown is not None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown role '{unknown}'. Available: {list(profiles.keys())}",
+            )
+        project_id = req.project_id
+        mutations = [
+            TeamMutation(
                 action=m.get("action", "add"),
                 role=role,
-                project_id=req.project_id,
+                project_id=project_id,
                 member_name=m.get("member_name"),
                 source_team=m.get("source_team"),
-            ))
+            )
+            for m, role in zip(req.mutations, roles)
+        ]
 
         # Get baseline risk from cache or let simulator estimate
         baseline = req.baseline_risk
         if baseline is None:
-            cached = get_cached_risk(req.project_id)
+            db_version = await asyncio.to_thread(get_cache_version)
+            cached = get_cached_risk(req.project_id, db_version)
             if cached:
                 baseline = cached.risk_score
 
-        results = team_simulator.simulate_batch(mutations, baseline)
+        results = await asyncio.to_thread(team_simulator.simulate_batch, mutations, baseline)
 
-        return {
+        # Returned as a response object so FastAPI skips the jsonable_encoder
+        # walk; the payload is already plain JSON types.
+        return ORJSONResponse({
             "project_id": req.project_id,
             "baseline_risk": baseline or results[0].baseline_risk if results else 0.3,
-            "simulations": [r.to_dict() for r in results],
-            "available_roles": list(ROLE_PROFILES.keys()),
-        }
+            "simulations": list(map(SimulationResult.to_dict, results)),
+            "available_roles": list(ROLE_PROFILES),
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -1160,108 +1669,312 @@ async def get_available_roles():
     }
 
 
+# ── Knowledge graph synthetic data ──
+# Built once at import; the node dicts are shared across responses, so
+# treat them as read-only.
+KG_SKILLS = (
+    ("React", "Frontend"), ("Vue.js", "Frontend"), ("Angular", "Frontend"),
+    ("TypeScript", "Frontend"), ("Tailwind", "Frontend"),
+    ("Python", "Backend"), ("Node.js", "Backend"), ("Go", "Backend"),
+    ("Java", "Backend"), ("FastAPI", "Backend"),
+    ("PostgreSQL", "Database"), ("MongoDB", "Database"), ("Neo4j", "Database"),
+    ("AWS", "Cloud"), ("Docker", "DevOps"), ("Kubernetes", "DevOps"),
+    ("Figma", "Design"), ("UI/UX", "Design"),
+    ("Machine Learning", "AI"), ("Data Analysis", "AI"),
+    ("Agile", "Management"), ("Scrum", "Management"),
+)
+
+KG_TICKET_TEMPLATES = (
+    ("Fix login timeout", "Bug", "High"),
+    ("Add dark mode", "Feature", "Medium"),
+    ("Optimize API", "Task", "High"),
+    ("Analytics dashboard", "Feature", "Medium"),
+    ("Memory leak fix", "Bug", "Critical"),
+    ("Update deps", "Task", "Low"),
+    ("SSO integration", "Feature", "High"),
+    ("Mobile responsive", "Bug", "Medium"),
+    ("Export to PDF", "Feature", "Low"),
+    ("Performance audit", "Task", "Medium"),
+)
+
+KG_TICKET_LABELS = tuple(f"{title[:20]}..." for title, _, _ in KG_TICKET_TEMPLATES)
+
+KG_STATUSES = ("Open", "In Progress", "Review", "Done")
+KG_RISK_LEVELS = ("low", "medium", "high", "critical")
+KG_COMM_FREQUENCIES = ("daily", "weekly", "monthly")
+
+KG_SKILL_IDS: Mapping[str, str] = MappingProxyType({
+    name: f"skill-{name.lower().replace(' ', '-').replace('/', '-')}"
+    for name, _ in KG_SKILLS
+})
+KG_SKILL_NODES = tuple(
+    {
+        "id": KG_SKILL_IDS[name],
+        "label": name,
+        "type": "skill",
+        "properties": {"category": category},
+    }
+    for name, category in KG_SKILLS
+)
+
+
+# Teams, members, projects and assignments in one roundtrip — each CALL {}
+# aggregates independently and returns a list.
+KG_GRAPH_QUERY = """
+    CALL {
+        MATCH (t:Team)
+        OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
+        OPTIONAL MATCH (t)-[:HAS_PROJECT]->(p:Project)
+        WITH t, count(DISTINCT m) AS member_count, count(DISTINCT p) AS project_count
+        RETURN collect({team: t { .* }, member_count: member_count, project_count: project_count}) AS teams
+    }
+    CALL {
+        MATCH (m:Member)
+        OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
+        OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
+        WHERE tk.status <> 'Done'
+        WITH m, t, count(DISTINCT tk) AS active_tickets
+        RETURN collect({member: m { .* }, team_id: t.id, active_tickets: active_tickets}) AS members
+    }
+    CALL {
+        MATCH (p:Project)<-[:HAS_PROJECT]-(t:Team)
+        OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
+        WHERE tk.status <> 'Done'
+        WITH p, t, count(DISTINCT tk) AS active_tickets
+        RETURN collect({project: p { .* }, team_id: t.id, active_tickets: active_tickets}) AS projects
+    }
+    CALL {
+        MATCH (m:Member)-[:ASSIGNED_TO]->(:Ticket)<-[:HAS_TICKET]-(p:Project)
+        WITH DISTINCT m.id AS member_id, p.id AS project_id
+        RETURN collect({member_id: member_id, project_id: project_id}) AS assignments
+    }
+    RETURN teams, members, projects, assignments
+"""
+
+
+def _seed(key: Any) -> int:
+    """Cheap deterministic 32-bit seed for an id (CRC32, not a crypto hash)."""
+    return zlib.crc32(str(key).encode())
+
+
+@lru_cache(maxsize=16)
+def _build_synthetic_graph(member_ids: tuple, project_ids: tuple) -> dict:
+    """
+    Synthetic enrichment (skills, tickets, dependencies, communication) for
+    the knowledge graph. It is a pure function of the member and project ids,
+    so it is memoized in process. The returned structure is shared — treat
+    it as read-only.
+    """
+    nodes: list = []
+    edges: list = []
+    member_skills: Dict[str, list] = {}
+    project_risk: Dict[str, str] = {}
+
+    # All id seeds in one pass, reused by position below
+    member_seeds = np.fromiter(map(_seed, member_ids), dtype=np.uint32, count=len(member_ids)).tolist()
+    project_seeds = np.fromiter(map(_seed, project_ids), dtype=np.uint32, count=len(project_ids)).tolist()
+
+    # Deterministic skill assignment based on member id
+    for member_id, seed in zip(member_ids, member_seeds):
+        rnd = random.Random(seed)
+        member_skills[member_id] = [name for name, _ in rnd.sample(KG_SKILLS, rnd.randint(2, 4))]
+
+    # Deterministic risk level
+    for project_id, seed in zip(project_ids, project_seeds):
+        rnd = random.Random(seed)
+        project_risk[project_id] = rnd.choices(KG_RISK_LEVELS, weights=[0.4, 0.35, 0.2, 0.05])[0]
+
+    # Add Skill nodes
+    nodes.extend(KG_SKILL_NODES)
+
+    # Connect members to skills
+    edges.extend(
+        {"source": member_id, "target": KG_SKILL_IDS[skill_name], "type": "HAS_SKILL"}
+        for member_id in member_ids
+        for skill_name in member_skills[member_id]
+    )
+
+    # Add Ticket nodes for each project — all draws for a project come
+    # from one seeded NumPy generator instead of per-ticket random calls
+    for project_id, seed in zip(project_ids, project_seeds):
+        rng = np.random.default_rng(seed)
+        num_tickets = int(rng.integers(3, 6))
+        template_idx = rng.integers(0, len(KG_TICKET_TEMPLATES), num_tickets).tolist()
+        statuses = [KG_STATUSES[i] for i in rng.integers(0, len(KG_STATUSES), num_tickets).tolist()]
+        prefix = f"tkt-{str(project_id)[-6:]}-"
+        ticket_ids = [f"{prefix}{i:02d}" for i in range(1, num_tickets + 1)]
+
+        nodes.extend(
+            {
+                "id": ticket_id,
+                "label": KG_TICKET_LABELS[t],
+                "type": "ticket",
+                "properties": {
+                    "title": title,
+                    "ticket_type": ticket_type,
+                    "priority": priority,
+                    "status": status,
+                }
+            }
+            for ticket_id, t, status in zip(ticket_ids, template_idx, statuses)
+            for title, ticket_type, priority in (KG_TICKET_TEMPLATES[t],)
+        )
+
+        # Connect tickets to project
+        edges.extend(
+            {"source": project_id, "target": ticket_id, "type": "HAS_TICKET"}
+            for ticket_id in ticket_ids
+        )
+
+        # Assign each ticket to a random member
+        if member_ids:
+            assignees = rng.integers(0, len(member_ids), num_tickets).tolist()
+            edges.extend(
+                {"source": member_ids[a], "target": ticket_id, "type": "ASSIGNED_TO"}
+                for ticket_id, a in zip(ticket_ids, assignees)
+            )
+
+    # Add project dependencies (some projects depend on others)
+    if len(project_ids) >= 2:
+        rnd = random.Random(42)  # Consistent dependencies
+        num_deps = min(6, len(project_ids) - 1)
+        n = len(project_ids)
+        for _ in range(num_deps):
+            i = rnd.randrange(n)
+            j = rnd.randrange(n - 1)
+            if j >= i:
+                j += 1
+            edges.append({
+                "source": project_ids[i],
+                "target": project_ids[j],
+                "type": "DEPENDS_ON"
+            })
+
+    # Add communication links between members — contact counts and
+    # frequencies are drawn as whole arrays from one generator
+    if len(member_ids) >= 2:
+        rng = np.random.default_rng(123)  # Consistent communication
+        n = len(member_ids)
+        num_contacts = rng.integers(1, min(3, n - 1) + 1, size=n).tolist()
+        pairs = []
+        for i, member_id in enumerate(member_ids):
+            # Sample among the other n-1 positions, then shift past self
+            idx = rng.choice(n - 1, num_contacts[i], replace=False)
+            idx[idx >= i] += 1
+            pairs.extend((member_id, member_ids[j]) for j in idx.tolist())
+        frequencies = rng.integers(0, len(KG_COMM_FREQUENCIES), size=len(pairs)).tolist()
+        edges.extend(
+            {
+                "source": member_id,
+                "target": contact,
+                "type": "COMMUNICATES_WITH",
+                "properties": {"frequency": KG_COMM_FREQUENCIES[f]}
+            }
+            for (member_id, contact), f in zip(pairs, frequencies)
+        )
+
+    return {
+        "member_skills": member_skills,
+        "project_risk": project_risk,
+        "nodes": nodes,
+        "edges": edges,
+    }
+
+
+KG_STREAM_BATCH = 512  # nodes/edges per encoded chunk
+
+
+def _iter_graph_json(nodes: list, edges: list):
+    """
+    Yield {"nodes": [...], "edges": [...]} as orjson-encoded chunks so the
+    client can start parsing before the whole body is built, and only one
+    batch is held in encoded form at a time.
+    """
+    for head, items in ((b'{"nodes":[', nodes), (b'],"edges":[', edges)):
+        yield head
+        for start in range(0, len(items), KG_STREAM_BATCH):
+            # Strip the enclosing [] of each batch and join with commas
+            chunk = orjson.dumps(items[start:start + KG_STREAM_BATCH])[1:-1]
+            yield b"," + chunk if start else chunk
+    yield b"]}"
+
+
+def _graph_json_chunks(nodes: list, edges: list, cache_key: Any, loop: asyncio.AbstractEventLoop):
+    """
+    Stream like _iter_graph_json, then cache the chunks under cache_key.
+    Starlette iterates sync generators on a worker thread, so the cache
+    write is handed back to the event loop.
+    """
+    chunks = []
+    for chunk in _iter_graph_json(nodes, edges):
+        chunks.append(chunk)
+        yield chunk
+    loop.call_soon_threadsafe(set_cached_graph, cache_key, tuple(chunks))
+
+
 @app.get("/api/graph/knowledge")
-async def get_knowledge_graph():
+async def get_knowledge_graph(enrich: bool = True):
     """
     Return knowledge graph data for neural visualization.
     Returns { nodes: [...], edges: [...] } with team, member, project, skill, and ticket nodes.
-    Includes synthetic data for skills, tickets, and relationships.
+    Includes synthetic data for skills, tickets, and relationships unless
+    ?enrich=false, which returns only the real Neo4j structure.
     """
-    import random
-    import hashlib
-    
-    # Skill definitions for synthetic data
-    SKILLS = [
-        ("React", "Frontend"), ("Vue.js", "Frontend"), ("Angular", "Frontend"),
-        ("TypeScript", "Frontend"), ("Tailwind", "Frontend"),
-        ("Python", "Backend"), ("Node.js", "Backend"), ("Go", "Backend"),
-        ("Java", "Backend"), ("FastAPI", "Backend"),
-        ("PostgreSQL", "Database"), ("MongoDB", "Database"), ("Neo4j", "Database"),
-        ("AWS", "Cloud"), ("Docker", "DevOps"), ("Kubernetes", "DevOps"),
-        ("Figma", "Design"), ("UI/UX", "Design"),
-        ("Machine Learning", "AI"), ("Data Analysis", "AI"),
-        ("Agile", "Management"), ("Scrum", "Management")
-    ]
-    
-    TICKET_TEMPLATES = [
-        ("Fix login timeout", "Bug", "High"),
-        ("Add dark mode", "Feature", "Medium"),
-        ("Optimize API", "Task", "High"),
-        ("Analytics dashboard", "Feature", "Medium"),
-        ("Memory leak fix", "Bug", "Critical"),
-        ("Update deps", "Task", "Low"),
-        ("SSO integration", "Feature", "High"),
-        ("Mobile responsive", "Bug", "Medium"),
-        ("Export to PDF", "Feature", "Low"),
-        ("Performance audit", "Task", "Medium"),
-    ]
-    
-    STATUSES = ["Open", "In Progress", "Review", "Done"]
-    
     try:
+        # The shared version is bumped by every CRUD write (in any process),
+        # the local one by this process's writes; writes made outside the
+        # API are picked up when the entry's TTL runs out
+        db_version = await asyncio.to_thread(get_cache_version)
+        cache_key = (db_version, get_graph_version(), enrich)
+        cached = get_cached_graph(cache_key)
+        if cached is not None:
+            return StreamingResponse(iter(cached), media_type="application/json")
+
         nodes = []
         edges = []
-        member_ids = []
-        project_ids = []
-        team_ids = []
-
-        # Get Teams
-        team_records, _ = neo4j_client.execute_query("""
-            MATCH (t:Team)
-            OPTIONAL MATCH (t)<-[:MEMBER_OF]-(m:Member)
-            OPTIONAL MATCH (t)-[:HAS_PROJECT]->(p:Project)
-            RETURN t { .* } as team, 
-                   count(DISTINCT m) as member_count,
-                   count(DISTINCT p) as project_count
-        """)
-        
-        for r in team_records:
-            team = dict(r["team"])
-            team_id = team.get("id", team.get("name"))
-            team_ids.append(team_id)
-            nodes.append({
-                "id": team_id,
+
+        records, _ = await neo4j_client.execute_query_async(KG_GRAPH_QUERY)
+        graph = records[0] if records else {}
+        team_records = graph.get("teams") or []
+        member_records = graph.get("members") or []
+        project_records = graph.get("projects") or []
+        assignment_records = graph.get("assignments") or []
+
+        nodes.extend(
+            {
+                "id": team.get("id", team.get("name")),
                 "label": team.get("name", "Unknown Team"),
                 "type": "team",
                 "properties": {
                     "members": r["member_count"],
                     "projects": r["project_count"],
                 }
-            })
+            }
+            for r in team_records
+            for team in (r["team"],)
+        )
 
-        # Get Members
-        member_records, _ = neo4j_client.execute_query("""
-            MATCH (m:Member)
-            OPTIONAL MATCH (m)-[:MEMBER_OF]->(t:Team)
-            OPTIONAL MATCH (m)-[:ASSIGNED_TO]->(tk:Ticket)
-            WHERE tk.status <> 'Done'
-            RETURN m { .* } as member,
-                   t.id as team_id,
-                   count(DISTINCT tk) as active_tickets
-        """)
-        
-        for r in member_records:
-            member = dict(r["member"])
-            member_id = member.get("id") or member.get("name") or f"mem-{random.randint(1000,9999)}"
+        # One pass per record list builds ids, nodes and team edges together;
+        # the synthetic properties are filled in afterwards by reference.
+        member_ids = []
+        member_props = []
+        # Fallback ids are positional so the same graph always yields the
+        # same ids (and the same synthetic-graph cache key)
+        for i, r in enumerate(member_records):
+            member = r["member"]
+            member_id = member.get("id") or member.get("name") or f"mem-{i}"
             member_ids.append(member_id)
-            
-            # Deterministic skill assignment based on member name
-            # Break down for linter
-            digest = str(hashlib.md5(str(member_id).encode()).hexdigest())
-            seed = int(cast(Any, digest)[0:8], 16)
-            random.seed(seed)
-            num_skills = random.randint(2, 4)
-            member_skills = random.sample(SKILLS, num_skills)
-            
+            props = {
+                "role": member.get("role", "N/A"),
+                "active_tickets": r["active_tickets"],
+                "skills": "",
+            }
+            member_props.append(props)
             nodes.append({
                 "id": member_id,
                 "label": member.get("name", "Unknown Member"),
                 "type": "member",
-                "properties": {
-                    "role": member.get("role", "N/A"),
-                    "active_tickets": r["active_tickets"],
-                    "skills": ", ".join([s[0] for s in member_skills]),
-                }
+                "properties": props,
             })
             
             # Add edge to team
@@ -1272,39 +1985,24 @@ async def get_knowledge_graph():
                     "type": "MEMBER_OF"
                 })
 
-        # Get Projects
-        project_records, _ = neo4j_client.execute_query("""
-            MATCH (p:Project)<-[:HAS_PROJECT]-(t:Team)
-            OPTIONAL MATCH (p)-[:HAS_TICKET]->(tk:Ticket)
-            WHERE tk.status <> 'Done'
-            RETURN p { .* } as project,
-                   t.id as team_id,
-                   count(DISTINCT tk) as active_tickets
-        """)
-        
-        risk_levels = ["low", "medium", "high", "critical"]
-        
-        for idx, r in enumerate(project_records):
-            project = dict(r["project"])
-            project_id = project.get("id") or project.get("name") or f"proj-{random.randint(1000,9999)}"
+        project_ids = []
+        project_props = []
+        for i, r in enumerate(project_records):
+            project = r["project"]
+            project_id = project.get("id") or project.get("name") or f"proj-{i}"
             project_ids.append(project_id)
-            
-            # Deterministic risk level
-            digest = str(hashlib.md5(str(project_id).encode()).hexdigest())
-            seed = int(cast(Any, digest)[0:8], 16)
-            random.seed(seed)
-            risk = random.choices(risk_levels, weights=[0.4, 0.35, 0.2, 0.05])[0]
-            
+            props = {
+                "status": project.get("status", "Unknown"),
+                "progress": project.get("progress", 0),
+                "active_tickets": r["active_tickets"],
+                "risk_level": None,
+            }
+            project_props.append(props)
             nodes.append({
                 "id": project_id,
                 "label": project.get("name", "Unknown Project"),
                 "type": "project",
-                "properties": {
-                    "status": project.get("status", "Unknown"),
-                    "progress": project.get("progress", 0),
-                    "active_tickets": r["active_tickets"],
-                    "risk_level": risk,
-                }
+                "properties": props,
             })
             
             # Add edge to team
@@ -1315,131 +2013,58 @@ async def get_knowledge_graph():
                     "type": "HAS_PROJECT"
                 })
 
-        # Get Member -> Project assignments (through tickets)
-        assignment_records, _ = neo4j_client.execute_query("""
-            MATCH (m:Member)-[:ASSIGNED_TO]->(tk:Ticket)<-[:HAS_TICKET]-(p:Project)
-            RETURN DISTINCT m.id as member_id, p.id as project_id
-        """)
-        
-        for r in assignment_records:
-            if r["member_id"] and r["project_id"]:
-                edges.append({
-                    "source": r["member_id"],
-                    "target": r["project_id"],
-                    "type": "WORKS_ON"
-                })
+        # Member -> Project assignments (through tickets)
+        edges.extend(
+            {"source": r["member_id"], "target": r["project_id"], "type": "WORKS_ON"}
+            for r in assignment_records
+            if r["member_id"] and r["project_id"]
+        )
 
         # ============= SYNTHETIC DATA ENRICHMENT =============
-        
-        # Add Skill nodes
-        skill_nodes = {}
-        for skill_name, category in SKILLS:
-            skill_id = f"skill-{skill_name.lower().replace(' ', '-').replace('/', '-')}"
-            skill_nodes[skill_name] = skill_id
-            nodes.append({
-                "id": skill_id,
-                "label": skill_name,
-                "type": "skill",
-                "properties": {
-                    "category": category,
-                }
-            })
-        
-        # Connect members to skills
-        for member_id in member_ids:
-            digest = str(hashlib.md5(str(member_id).encode()).hexdigest())
-            seed = int(cast(Any, digest)[0:8], 16)
-            random.seed(seed)
-            num_skills = random.randint(2, 4)
-            member_skills = random.sample(SKILLS, num_skills)
-            
-            for skill_name, _ in member_skills:
-                edges.append({
-                    "source": member_id,
-                    "target": skill_nodes[skill_name],
-                    "type": "HAS_SKILL"
-                })
-        
-        # Add Ticket nodes for each project
-        ticket_count: int = 0
-        for project_id in project_ids:
-            digest = str(hashlib.md5(str(project_id).encode()).hexdigest())
-            seed = int(cast(Any, digest)[0:8], 16)
-            random.seed(seed)
-            num_tickets = random.randint(3, 5)
-            
-            for i in range(num_tickets):
-                template = random.choice(TICKET_TEMPLATES)
-                title, ticket_type, priority = template
-                status = random.choice(STATUSES)
-                pid_str = str(project_id)
-                ticket_id = f"tkt-{cast(Any, pid_str)[-6:]}-{i+1:02d}"
-                
-                nodes.append({
-                    "id": ticket_id,
-                    "label": f"{cast(Any, title)[:20]}...",
-                    "type": "ticket",
-                    "properties": {
-                        "title": title,
-                        "ticket_type": ticket_type,
-                        "priority": priority,
-                        "status": status,
-                    }
-                })
-                
-                # Connect ticket to project
-                edges.append({
-                    "source": project_id,
-                    "target": ticket_id,
-                    "type": "HAS_TICKET"
-                })
-                
-                # Assign to a random member
-                if member_ids:
-                    assignee = random.choice(member_ids)
-                    edges.append({
-                        "source": assignee,
-                        "target": ticket_id,
-                        "type": "ASSIGNED_TO"
-                    })
-                
-                ticket_count = ticket_count + 1
-        
-        # Add project dependencies (some projects depend on others)
-        if len(project_ids) >= 2:
-            random.seed(42)  # Consistent dependencies
-            num_deps = min(6, len(project_ids) - 1)
-            for _ in range(num_deps):
-                p1 = random.choice(project_ids)
-                p2 = random.choice([p for p in project_ids if p != p1])
-                edges.append({
-                    "source": p1,
-                    "target": p2,
-                    "type": "DEPENDS_ON"
-                })
-        
-        # Add communication links between members
-        if len(member_ids) >= 2:
-            random.seed(123)  # Consistent communication
-            frequencies = ["daily", "weekly", "monthly"]
-            for member_id in member_ids:
-                num_contacts = random.randint(1, min(3, len(member_ids) - 1))
-                contacts = random.sample([m for m in member_ids if m != member_id], num_contacts)
-                for contact in contacts:
-                    edges.append({
-                        "source": member_id,
-                        "target": contact,
-                        "type": "COMMUNICATES_WITH",
-                        "properties": {"frequency": random.choice(frequencies)}
-                    })
-
-        return {"nodes": nodes, "edges": edges}
+        if enrich:
+            # Sorted so the synthetic layer doesn't depend on row order
+            synthetic = _build_synthetic_graph(tuple(sorted(member_ids, key=str)), tuple(sorted(project_ids, key=str)))
+            member_skills = synthetic["member_skills"]
+            project_risk = synthetic["project_risk"]
+            for member_id, props in zip(member_ids, member_props):
+                props["skills"] = ", ".join(member_skills[member_id])
+            for project_id, props in zip(project_ids, project_props):
+                props["risk_level"] = project_risk[project_id]
+            nodes.extend(synthetic["nodes"])
+            edges.extend(synthetic["edges"])
+
+        # Encoded chunk by chunk while streaming; the finished chunks are
+        # cached so hits replay them without re-serializing
+        return StreamingResponse(
+            _graph_json_chunks(nodes, edges, cache_key, asyncio.get_running_loop()),
+            media_type="application/json",
+        )
         
     except Exception as e:
         logger.error(f"Knowledge graph error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Hot read paths planned at startup (see _prepare_database). Parameters only
+# need the right shape — EXPLAIN plans the statement without running it.
+WARMUP_QUERIES = (
+    (RISK_PREFETCH_QUERY, None),
+    (DASHBOARD_ENGINEER_QUERY, None),
+    (DASHBOARD_HR_QUERY, None),
+    (DASHBOARD_CHAIRPERSON_QUERY, None),
+    (DASHBOARD_FINANCE_TEAMS_QUERY, None),
+    (DASHBOARD_FINANCE_PROJECTS_QUERY, None),
+    (GRAPH_DATA_QUERY, None),
+    (RISK_SNAPSHOT_QUERY, {"pid": "", "pname": "", "score": 0.0, "level": "", "blocked": 0,
+                           "overdue": 0, "total": 0, "ts": ""}),
+    (RISK_HISTORY_QUERY, {"pid": "", "lim": 1}),
+    (RISK_HISTORY_BATCH_QUERY, {"pids": [], "lim": 1}),
+    (NARRATIVE_PROJECTS_QUERY, None),
+    (NARRATIVE_WORKFORCE_QUERY, {"preview": 1}),
+    (KG_GRAPH_QUERY, None),
+)
+
+
 @app.get("/")
 def health_check():
     connected = False
@@ -1457,9 +2082,9 @@ def health_check():
         "neo4j_status": "connected" if connected else "unavailable",
         "endpoints": {
             "crud": ["/api/teams", "/api/projects/{id}", "/api/tickets/{id}"],
-            "ai": ["/api/analyze/{project_id}", "/api/chat", "/api/chat/stream", "/api/risk-snapshot/{project_id}", "/api/risk-history/{project_id}", "/api/postmortem/{project_id}", "/api/narrative/{role}"],
+            "ai": ["/api/analyze/{project_id}", "/api/chat", "/api/chat/stream", "/api/risk-snapshot/{project_id}", "/api/risk-history/{project_id}", "/api/risk-history/batch", "/api/postmortem/{project_id}", "/api/postmortem/{project_id}/stream", "/api/narrative/{role}", "/api/narrative/{role}/stream"],
             "simulator": ["/api/simulate-team", "/api/simulate-team/roles"],
-            "reports": ["/api/company-report", "/api/company-report/generate"],
+            "reports": ["/api/company-report", "/api/company-report/generate", "/api/company-report/generate/stream"],
             "roles": ["/api/roles", "/api/system-users", "/api/dashboard/{role}"],
         }
     }
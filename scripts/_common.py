@@ -0,0 +1,26 @@
+"""
+Shared helpers for the API probe scripts (test_debate, test_graph_signals).
+"""
+import functools
+
+import requests
+
+BASE_URL = "http://127.0.0.1:8000/api"
+
+# One keep-alive connection for every request the script makes
+session = requests.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def get_first_project(base_url=BASE_URL):
+    try:
+        response = session.get(f"{base_url}/teams")
+        response.raise_for_status()
+        teams = response.json()
+        for team in teams:
+            if team.get("projects"):
+                return team["projects"][0]["id"]
+    except Exception as e:
+        print(f"Error fetching teams: {e}")
+        return None
+    return None
@@ -3,18 +3,38 @@ Seed Script for Knowledge Graph Expansion
 Adds synthetic data: Skills, Tickets, Dependencies, Communication Links
 """
 import random
-from neo4j import GraphDatabase
+import sys
+from neo4j import GraphDatabase, unit_of_work
 import os
 from dotenv import load_dotenv
 
+# Schema definitions are shared with the API
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+from app.core.schema import apply_schema
+
 load_dotenv()
 
 # Neo4j connection
 NEO4J_URI = os.getenv("NEO4J_URI", "")
 NEO4J_USER = os.getenv("NEO4J_USERNAME", "neo4j")
 NEO4J_PASS = os.getenv("NEO4J_PASSWORD", "")
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
+
+# The seed uses one session at a time, so a small pool is plenty; the long
+# acquisition timeout and the retry window (used by session.execute_write)
+# ride out a busy or waking Aura instance
+driver = GraphDatabase.driver(
+    NEO4J_URI,
+    auth=(NEO4J_USER, NEO4J_PASS),
+    max_connection_pool_size=10,
+    connection_acquisition_timeout=60,
+    max_transaction_retry_time=30,
+    keep_alive=True,
+)
 
-driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASS))
+# Script-local generator: the same SEED regenerates the same graph
+SEED = int(os.getenv("SEED", "42"))
+rng = random.Random(SEED)
 
 # ============== DATA ==============
 
@@ -52,168 +72,214 @@ TICKET_TEMPLATES = [
 
 TICKET_STATUSES = ["Open", "In Progress", "Review", "Done"]
 
+# Rows per UNWIND statement for batched writes
+SEED_BATCH = 20000
+
 # ============== SEEDING FUNCTIONS ==============
 
+def create_constraints(session):
+    """Create the shared constraints/indexes so MERGE/MATCH by key is an index seek"""
+    # Schema changes can't share a transaction with writes, so each runs
+    # in its own auto-commit transaction before the seed; failures abort
+    apply_schema(lambda query, params=None: list(session.run(query, params or {})))
+    print("✓ Ensured schema constraints and indexes")
+
+def run_batched(tx, query, rows):
+    """
+    Run an UNWIND $rows query over an iterable of parameter rows, one
+    statement per SEED_BATCH rows, so the full row list is never built.
+    Returns the number of rows written.
+    """
+    batch = []
+    total = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= SEED_BATCH:
+            tx.run(query, rows=batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        tx.run(query, rows=batch)
+        total += len(batch)
+    return total
+
 def clear_seeded_data(tx):
     """Remove previously seeded data (idempotent)"""
+    # Runs inside the seed transaction, so the old data is only gone once
+    # the new seed commits (CALL ... IN TRANSACTIONS would commit the
+    # delete on its own and can't run here)
     tx.run("MATCH (s:Skill) DETACH DELETE s")
     tx.run("MATCH (t:Ticket) DETACH DELETE t")
-    tx.run("MATCH ()-[r:COMMUNICATES_WITH]-() DELETE r")
-    tx.run("MATCH ()-[r:DEPENDS_ON]-() DELETE r")
+    tx.run("MATCH ()-[r:COMMUNICATES_WITH]->() DELETE r")
+    tx.run("MATCH ()-[r:DEPENDS_ON]->() DELETE r")
     print("✓ Cleared previous seeded data")
 
 def seed_skills(tx):
     """Create Skill nodes"""
-    for name, category in SKILLS:
-        tx.run("""
-            MERGE (s:Skill {name: $name})
-            SET s.category = $category
-        """, name=name, category=category)
+    tx.run("""
+        UNWIND $skills AS row
+        MERGE (s:Skill {name: row.name})
+        SET s.category = row.category
+    """, skills=[{"name": name, "category": category} for name, category in SKILLS])
     print(f"✓ Created {len(SKILLS)} Skill nodes")
 
 def assign_skills_to_members(tx):
     """Connect members to random skills"""
-    result = tx.run("MATCH (m:Member) RETURN m.id as id, m.name as name")
-    members = list(result)
+    def pairs():
+        # Stream members off the result cursor; each gets 2-5 random skills
+        for member in tx.run("MATCH (m:Member) RETURN m.id as id"):
+            for skill_name, _ in rng.sample(SKILLS, rng.randint(2, 5)):
+                yield {"member_id": member["id"], "skill_name": skill_name}
     
-    count = 0
-    for member in members:
-        # Each member gets 2-5 random skills
-        num_skills = random.randint(2, 5)
-        selected_skills = random.sample(SKILLS, num_skills)
-        
-        for skill_name, _ in selected_skills:
-            tx.run("""
-                MATCH (m:Member {id: $member_id})
-                MATCH (s:Skill {name: $skill_name})
-                MERGE (m)-[:HAS_SKILL]->(s)
-            """, member_id=member["id"], skill_name=skill_name)
-            count += 1
+    count = run_batched(tx, """
+        UNWIND $rows AS row
+        MATCH (m:Member {id: row.member_id})
+        MATCH (s:Skill {name: row.skill_name})
+        MERGE (m)-[:HAS_SKILL]->(s)
+    """, pairs())
     
     print(f"✓ Created {count} HAS_SKILL relationships")
 
 def seed_tickets(tx):
     """Create Ticket nodes and connect to projects/members"""
-    # Get all projects and members
-    projects = list(tx.run("MATCH (p:Project) RETURN p.id as id, p.name as name"))
-    members = list(tx.run("MATCH (m:Member) RETURN m.id as id, m.name as name"))
+    # Assignees are drawn at random, so member ids are held in full;
+    # projects are streamed off the result cursor
+    member_ids = [record["id"] for record in tx.run("MATCH (m:Member) RETURN m.id as id")]
     
-    if not projects or not members:
-        print("⚠ No projects or members found, skipping tickets")
+    if not member_ids:
+        print("⚠ No members found, skipping tickets")
         return
     
-    ticket_count = 0
-    for project in projects:
-        # Each project gets 3-6 tickets
-        num_tickets = random.randint(3, 6)
-        
-        for i in range(num_tickets):
-            template = random.choice(TICKET_TEMPLATES)
-            title, ticket_type, priority = template
-            status = random.choice(TICKET_STATUSES)
-            ticket_id = f"TKT-{project['id'][-4:]}-{i+1:03d}"
+    def rows():
+        for project in tx.run("MATCH (p:Project) RETURN p.id as id, p.name as name"):
+            # Each project gets 3-6 tickets; templates, statuses and
+            # assignees are drawn for all of them at once
+            num_tickets = rng.randint(3, 6)
+            templates = rng.choices(TICKET_TEMPLATES, k=num_tickets)
+            statuses = rng.choices(TICKET_STATUSES, k=num_tickets)
+            assignees = rng.choices(member_ids, k=num_tickets)
+            project_id = project["id"]
+            id_prefix = f"TKT-{project_id[-4:]}-"
+            title_suffix = f" ({project['name'][:10]})"
             
-            # Create ticket
-            tx.run("""
-                MERGE (t:Ticket {id: $id})
-                SET t.title = $title,
-                    t.type = $type,
-                    t.priority = $priority,
-                    t.status = $status,
-                    t.project_id = $project_id
-            """, id=ticket_id, title=f"{title} ({project['name'][:10]})", 
-                type=ticket_type, priority=priority, status=status, project_id=project["id"])
-            
-            # Connect to project
-            tx.run("""
-                MATCH (p:Project {id: $project_id})
-                MATCH (t:Ticket {id: $ticket_id})
-                MERGE (p)-[:HAS_TICKET]->(t)
-            """, project_id=project["id"], ticket_id=ticket_id)
-            
-            # Assign to random member
-            assignee = random.choice(members)
-            tx.run("""
-                MATCH (m:Member {id: $member_id})
-                MATCH (t:Ticket {id: $ticket_id})
-                MERGE (m)-[:ASSIGNED_TO]->(t)
-            """, member_id=assignee["id"], ticket_id=ticket_id)
-            
-            ticket_count += 1
+            for i, ((title, ticket_type, priority), status, member_id) in enumerate(
+                zip(templates, statuses, assignees), start=1
+            ):
+                yield {
+                    "id": f"{id_prefix}{i:03d}",
+                    "title": title + title_suffix,
+                    "type": ticket_type,
+                    "priority": priority,
+                    "status": status,
+                    "project_id": project_id,
+                    "member_id": member_id,
+                }
+    
+    # Create the tickets and link each to its project and a random assignee
+    # with one UNWIND per batch, keeping t bound and resolving project and
+    # assignee in a single MATCH before both MERGEs
+    ticket_count = run_batched(tx, """
+        UNWIND $rows AS row
+        MERGE (t:Ticket {id: row.id})
+        SET t.title = row.title,
+            t.type = row.type,
+            t.priority = row.priority,
+            t.status = row.status,
+            t.project_id = row.project_id
+        WITH t, row
+        MATCH (p:Project {id: row.project_id}), (m:Member {id: row.member_id})
+        MERGE (p)-[:HAS_TICKET]->(t)
+        MERGE (m)-[:ASSIGNED_TO]->(t)
+    """, rows())
     
     print(f"✓ Created {ticket_count} Ticket nodes with assignments")
 
 def seed_project_dependencies(tx):
     """Create DEPENDS_ON relationships between projects"""
-    projects = list(tx.run("MATCH (p:Project) RETURN p.id as id, p.name as name"))
+    project_ids = [record["id"] for record in tx.run("MATCH (p:Project) RETURN p.id as id")]
     
-    if len(projects) < 2:
+    if len(project_ids) < 2:
         print("⚠ Not enough projects for dependencies")
         return
     
-    count = 0
-    # Create some logical dependencies
-    for i in range(min(8, len(projects) - 1)):
-        p1 = projects[i]
-        p2 = random.choice([p for p in projects if p["id"] != p1["id"]])
-        
-        tx.run("""
-            MATCH (p1:Project {id: $p1_id})
-            MATCH (p2:Project {id: $p2_id})
-            MERGE (p1)-[:DEPENDS_ON]->(p2)
-        """, p1_id=p1["id"], p2_id=p2["id"])
-        count += 1
-    
-    print(f"✓ Created {count} DEPENDS_ON relationships")
+    # Create some logical dependencies. The target is drawn from the n-1
+    # other indices and shifted past the source's slot, instead of
+    # rebuilding a filtered copy of the project list on every iteration.
+    n = len(project_ids)
+    deps = []
+    for i in range(min(8, n - 1)):
+        j = rng.randrange(n - 1)
+        j += j >= i
+        deps.append({"p1_id": project_ids[i], "p2_id": project_ids[j]})
 
-def seed_communication_links(tx):
+    tx.run("""
+        UNWIND $deps AS row
+        MATCH (p1:Project {id: row.p1_id})
+        MATCH (p2:Project {id: row.p2_id})
+        MERGE (p1)-[:DEPENDS_ON]->(p2)
+    """, deps=deps)
+
+    print(f"✓ Created {len(deps)} DEPENDS_ON relationships")
+
+def seed_communication_links(session):
     """Create COMMUNICATES_WITH relationships between members"""
-    members = list(tx.run("MATCH (m:Member) RETURN m.id as id, m.name as name"))
+    member_ids = [record["id"] for record in session.run("MATCH (m:Member) RETURN m.id as id")]
     
-    if len(members) < 2:
+    if len(member_ids) < 2:
         print("⚠ Not enough members for communication")
         return
     
-    count = 0
     frequencies = ["daily", "weekly", "monthly"]
     
-    # Create communication links (each member talks to 2-4 others)
-    for member in members:
-        num_connections = random.randint(2, min(4, len(members) - 1))
-        contacts = random.sample([m for m in members if m["id"] != member["id"]], num_connections)
-        
-        for contact in contacts:
-            # Only create if not already exists (to avoid duplicates)
-            existing = tx.run("""
-                MATCH (m1:Member {id: $m1_id})-[r:COMMUNICATES_WITH]-(m2:Member {id: $m2_id})
-                RETURN count(r) as cnt
-            """, m1_id=member["id"], m2_id=contact["id"]).single()["cnt"]
-            
-            if existing == 0:
-                tx.run("""
-                    MATCH (m1:Member {id: $m1_id})
-                    MATCH (m2:Member {id: $m2_id})
-                    CREATE (m1)-[:COMMUNICATES_WITH {frequency: $freq}]->(m2)
-                """, m1_id=member["id"], m2_id=contact["id"], freq=random.choice(frequencies))
-                count += 1
+    # Create communication links (each member talks to 2-4 others). Draw
+    # from the n-1 other indices and shift past the member's own slot, so
+    # no per-member copy of the member list is built. Pairs are keyed by
+    # their sorted ids, so a pair is linked once, in a canonical direction,
+    # whichever member drew it first.
+    n = len(member_ids)
+    links = {}
+    for i, member_id in enumerate(member_ids):
+        num_connections = rng.randint(2, min(4, n - 1))
+        for j in rng.sample(range(n - 1), num_connections):
+            contact_id = member_ids[j + (j >= i)]
+            pair = (member_id, contact_id) if member_id < contact_id else (contact_id, member_id)
+            if pair not in links:
+                links[pair] = rng.choice(frequencies)
+    pairs = [{"m1_id": a, "m2_id": b, "freq": freq} for (a, b), freq in links.items()]
     
-    print(f"✓ Created {count} COMMUNICATES_WITH relationships")
+    # Auto-commit transaction (CALL ... IN TRANSACTIONS can't run inside an
+    # explicit one): the server commits every 1000 rows, so the edge batch
+    # never has to be held in a single transaction
+    session.run("""
+        UNWIND $pairs AS row
+        CALL {
+            WITH row
+            MATCH (m1:Member {id: row.m1_id})
+            MATCH (m2:Member {id: row.m2_id})
+            MERGE (m1)-[r:COMMUNICATES_WITH]->(m2)
+            ON CREATE SET r.frequency = row.freq
+        } IN TRANSACTIONS OF 1000 ROWS
+    """, pairs=pairs).consume()
+    
+    print(f"✓ Created {len(pairs)} COMMUNICATES_WITH relationships")
 
 def add_risk_levels_to_projects(tx):
     """Add risk_level property to projects"""
     risk_levels = ["low", "medium", "high", "critical"]
     weights = [0.4, 0.35, 0.2, 0.05]  # More low/medium, fewer high/critical
     
-    projects = list(tx.run("MATCH (p:Project) RETURN p.id as id"))
-    
-    for project in projects:
-        risk = random.choices(risk_levels, weights=weights)[0]
-        tx.run("""
-            MATCH (p:Project {id: $id})
-            SET p.risk_level = $risk
-        """, id=project["id"], risk=risk)
-    
-    print(f"✓ Added risk levels to {len(projects)} projects")
+    project_ids = [record["id"] for record in tx.run("MATCH (p:Project) RETURN p.id as id")]
+
+    # One weighted draw for all projects (the cumulative weights are built once)
+    risks = rng.choices(risk_levels, weights=weights, k=len(project_ids))
+    rows = [{"id": project_id, "risk": risk} for project_id, risk in zip(project_ids, risks)]
+    tx.run("""
+        UNWIND $rows AS row
+        MATCH (p:Project {id: row.id})
+        SET p.risk_level = row.risk
+    """, rows=rows)
+
+    print(f"✓ Added risk levels to {len(project_ids)} projects")
 
 def print_stats(tx):
     """Print graph statistics"""
@@ -221,24 +287,29 @@ def print_stats(tx):
     print("GRAPH STATISTICS")
     print("="*50)
     
-    stats = [
-        ("Teams", "MATCH (n:Team) RETURN count(n) as c"),
-        ("Members", "MATCH (n:Member) RETURN count(n) as c"),
-        ("Projects", "MATCH (n:Project) RETURN count(n) as c"),
-        ("Skills", "MATCH (n:Skill) RETURN count(n) as c"),
-        ("Tickets", "MATCH (n:Ticket) RETURN count(n) as c"),
-        ("HAS_SKILL", "MATCH ()-[r:HAS_SKILL]->() RETURN count(r) as c"),
-        ("HAS_TICKET", "MATCH ()-[r:HAS_TICKET]->() RETURN count(r) as c"),
-        ("ASSIGNED_TO", "MATCH ()-[r:ASSIGNED_TO]->() RETURN count(r) as c"),
-        ("DEPENDS_ON", "MATCH ()-[r:DEPENDS_ON]->() RETURN count(r) as c"),
-        ("COMMUNICATES_WITH", "MATCH ()-[r:COMMUNICATES_WITH]->() RETURN count(r) as c"),
-    ]
+    # Every count in one query; each is answered from the count store
+    stats = tx.run("""
+        CALL { MATCH (n:Team) RETURN count(n) AS teams }
+        CALL { MATCH (n:Member) RETURN count(n) AS members }
+        CALL { MATCH (n:Project) RETURN count(n) AS projects }
+        CALL { MATCH (n:Skill) RETURN count(n) AS skills }
+        CALL { MATCH (n:Ticket) RETURN count(n) AS tickets }
+        CALL { MATCH ()-[r:HAS_SKILL]->() RETURN count(r) AS has_skill }
+        CALL { MATCH ()-[r:HAS_TICKET]->() RETURN count(r) AS has_ticket }
+        CALL { MATCH ()-[r:ASSIGNED_TO]->() RETURN count(r) AS assigned_to }
+        CALL { MATCH ()-[r:DEPENDS_ON]->() RETURN count(r) AS depends_on }
+        CALL { MATCH ()-[r:COMMUNICATES_WITH]->() RETURN count(r) AS communicates_with }
+        RETURN teams AS Teams, members AS Members, projects AS Projects,
+               skills AS Skills, tickets AS Tickets,
+               has_skill AS HAS_SKILL, has_ticket AS HAS_TICKET,
+               assigned_to AS ASSIGNED_TO, depends_on AS DEPENDS_ON,
+               communicates_with AS COMMUNICATES_WITH
+    """).single()
     
     total_nodes = 0
     total_edges = 0
     
-    for name, query in stats:
-        count = tx.run(query).single()["c"]
+    for name, count in stats.items():
         print(f"  {name}: {count}")
         if name in ["Teams", "Members", "Projects", "Skills", "Tickets"]:
             total_nodes += count
@@ -250,20 +321,40 @@ def print_stats(tx):
     print(f"  TOTAL EDGES: {total_edges}")
     print("="*50)
 
+SEED_STEPS = (
+    clear_seeded_data,
+    seed_skills,
+    assign_skills_to_members,
+    seed_tickets,
+    seed_project_dependencies,
+    add_risk_levels_to_projects,
+)
+
 # ============== MAIN ==============
 
+@unit_of_work(timeout=300)
+def seed_all(tx):
+    # Reseeded on every attempt so a retried transaction writes the same graph
+    rng.seed(SEED)
+    for step in SEED_STEPS:
+        step(tx)
+
 def main():
     print("\n🚀 Starting Knowledge Graph Expansion Seed\n")
     
-    with driver.session() as session:
-        # Clear and seed
-        session.execute_write(clear_seeded_data)
-        session.execute_write(seed_skills)
-        session.execute_write(assign_skills_to_members)
-        session.execute_write(seed_tickets)
-        session.execute_write(seed_project_dependencies)
-        session.execute_write(seed_communication_links)
-        session.execute_write(add_risk_levels_to_projects)
+    # Naming the database up front saves the driver a home-database lookup
+    with driver.session(database=NEO4J_DATABASE) as session:
+        create_constraints(session)
+        
+        # Clear and seed in one managed transaction: statements are sent
+        # back-to-back without a commit round-trip between steps, a failed
+        # run leaves the previous data untouched, and transient failures
+        # are retried
+        session.execute_write(seed_all)
+        
+        # Communication links are batched server-side in their own
+        # auto-commit transactions, after the rest of the seed is committed
+        seed_communication_links(session)
         
         # Print final stats
         session.execute_read(print_stats)
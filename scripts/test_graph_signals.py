@@ -1,27 +1,13 @@
-import requests
 import json
 import sys
 
-BASE_URL = "http://127.0.0.1:8000/api"
-
-def get_first_project():
-    try:
-        response = requests.get(f"{BASE_URL}/teams")
-        response.raise_for_status()
-        teams = response.json()
-        for team in teams:
-            if team.get("projects"):
-                return team["projects"][0]["id"]
-    except Exception as e:
-        print(f"Error fetching teams: {e}")
-        return None
-    return None
+from _common import BASE_URL, get_first_project, session
 
 def test_signals(project_id):
     print(f"Testing signals for project: {project_id}")
     url = f"{BASE_URL}/projects/{project_id}/signals"
     try:
-        response = requests.get(url)
+        response = session.get(url)
         response.raise_for_status()
         data = response.json()
         print(json.dumps(data, indent=2))
@@ -3,11 +3,14 @@ import json
 
 API_BASE = "http://localhost:8000"
 
+# One keep-alive connection for every request the script makes
+session = requests.Session()
+
 def test_hiring_analytics():
     print("🧪 Testing Hiring Analytics API...")
     
     try:
-        resp = requests.get(f"{API_BASE}/api/hiring/analytics", timeout=10)
+        resp = session.get(f"{API_BASE}/api/hiring/analytics", timeout=10)
         resp.raise_for_status()
         data = resp.json()
         
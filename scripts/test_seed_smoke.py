@@ -0,0 +1,82 @@
+"""
+Smoke test for seed_graph_data: runs every seed step against a stub
+transaction/session (no database needed) and checks the expected writes
+were issued.
+"""
+import os
+import sys
+
+# The driver is created lazily at import; it only needs a well-formed URI
+os.environ.setdefault("NEO4J_URI", "neo4j://localhost:7687")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import seed_graph_data as seed
+
+MEMBERS = [{"id": f"m{i}", "name": f"Member {i}"} for i in range(6)]
+PROJECTS = [{"id": f"proj-{i:04d}", "name": f"Project {i}"} for i in range(4)]
+
+
+class StubResult(list):
+    def consume(self):
+        return None
+
+    def single(self):
+        return self[0] if self else None
+
+
+class StubTx:
+    """Records every statement and answers the seed's id lookups."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, query, parameters=None, **kwargs):
+        params = dict(parameters or {}, **kwargs)
+        self.calls.append((query, params))
+        if "MATCH (m:Member) RETURN" in query:
+            return StubResult(MEMBERS)
+        if "MATCH (p:Project) RETURN" in query:
+            return StubResult(PROJECTS)
+        if "AS Teams" in query:
+            return StubResult([{"Teams": 1, "Members": len(MEMBERS)}])
+        return StubResult()
+
+    def rows_for(self, fragment):
+        return [
+            row
+            for query, params in self.calls if fragment in query
+            for row in params.get("rows") or params.get("pairs") or params.get("deps") or params.get("skills") or []
+        ]
+
+
+def test_seed_steps():
+    tx = StubTx()
+    seed.seed_all(tx)
+    seed.seed_communication_links(tx)
+    seed.print_stats(tx)
+
+    assert tx.rows_for("MERGE (s:Skill"), "no skills written"
+    assert tx.rows_for("MERGE (m)-[:HAS_SKILL]->(s)"), "no skill assignments written"
+    tickets = tx.rows_for("MERGE (t:Ticket")
+    assert 3 * len(PROJECTS) <= len(tickets) <= 6 * len(PROJECTS), "unexpected ticket count"
+    assert tx.rows_for("DEPENDS_ON"), "no dependencies written"
+    assert tx.rows_for("r:COMMUNICATES_WITH]->(m2)"), "no communication links written"
+    assert tx.rows_for("SET p.risk_level"), "no risk levels written"
+
+
+def test_seed_all_is_repeatable():
+    # execute_write may retry seed_all; every attempt must write the same rows
+    first, second = StubTx(), StubTx()
+    seed.seed_all(first)
+    seed.seed_all(second)
+    assert first.calls == second.calls, "retried seed wrote a different graph"
+
+
+if __name__ == "__main__":
+    try:
+        test_seed_steps()
+        test_seed_all_is_repeatable()
+        print("✅ Seed steps ran against the stub transaction")
+    except Exception as e:
+        print(f"❌ Seed smoke test failed: {e!r}")
+        sys.exit(1)
@@ -1,6 +1,8 @@
 import sys
 import os
 
+import numpy as np
+
 # Add backend to path
 sys.path.append(os.path.join(os.getcwd(), "api"))
 
@@ -9,6 +11,8 @@ from app.agents.simulation import SimulationAgent
 def test_simulation_logic():
     print("🧪 Testing Real Monte Carlo Simulation Logic...")
     sim = SimulationAgent()
+    # One seeded generator for both runs: reproducible, and built only once
+    rng = np.random.default_rng(0)
     
     # Baseline Context
     baseline_context = {
@@ -31,12 +35,12 @@ def test_simulation_logic():
     }
     
     print("\n--- Running Baseline Simulation (ADD_ENGINEER) ---")
-    baseline_mc = sim._monte_carlo("ADD_ENGINEER", baseline_context)
+    baseline_mc = sim._monte_carlo("ADD_ENGINEER", baseline_context, rng=rng)
     print(f"Baseline Mean Risk Reduction: {baseline_mc['mean_rr']:.2%}")
     print(f"Baseline P95 Risk Reduction: {baseline_mc['p95_rr']:.2%}")
     
     print("\n--- Running Adverse Simulation (High Dependency Depth) ---")
-    adverse_mc = sim._monte_carlo("ADD_ENGINEER", adverse_context)
+    adverse_mc = sim._monte_carlo("ADD_ENGINEER", adverse_context, rng=rng)
     print(f"Adverse Mean Risk Reduction: {adverse_mc['mean_rr']:.2%}")
     print(f"Adverse P95 Risk Reduction: {adverse_mc['p95_rr']:.2%}")
     
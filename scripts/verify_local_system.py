@@ -3,6 +3,7 @@ import os
 import time
 import requests
 import subprocess
+import tempfile
 import logging
 
 # Add api to path
@@ -41,26 +42,36 @@ def test_shutdown_resilience():
     """Start backend, check health, then shut it down"""
     logger.info("🧪 Testing Backend Startup & Shutdown...")
     
-    # Start Backend
+    # Start Backend. Output goes to a temp file rather than an undrained
+    # pipe, which would block the server once the pipe buffer filled
+    server_log = tempfile.TemporaryFile(mode="w+")
     process = subprocess.Popen(
         ["uvicorn", "api.app.main:app", "--port", "8001"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stdout=server_log,
+        stderr=subprocess.STDOUT,
         text=True
     )
     
     try:
-        # Wait for potential startup
-        time.sleep(5)
+        # Poll until healthy (backing off up to 1s between probes) instead
+        # of sleeping a fixed time; give up after 30s
+        healthy = False
+        deadline = time.monotonic() + 30
+        delay = 0.1
+        while time.monotonic() < deadline and process.poll() is None:
+            if check_backend_health():
+                healthy = True
+                break
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
         
         # Check API
-        if check_backend_health():
+        if healthy:
             logger.info("✅ Backend started successfully without crashing (Lazy Loading Verification)")
         else:
             logger.error("❌ Backend failed to start or is unhealthy")
-            out, err = process.communicate(timeout=2)
-            logger.error(f"Output: {out}")
-            logger.error(f"Error: {err}")
+            server_log.seek(0)
+            logger.error(f"Output: {server_log.read()}")
             return False
             
     finally:
@@ -72,6 +83,7 @@ def test_shutdown_resilience():
         except subprocess.TimeoutExpired:
             process.kill()
             logger.warning("⚠️ Backend process forced kill")
+        server_log.close()
 
     return True
 